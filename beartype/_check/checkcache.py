@@ -12,7 +12,11 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
-from beartype._check.code.codescope import _tuple_union_to_tuple_union
+from beartype._check.code.codescope import (
+    _ref_name_to_ref_placeholder,
+    _tuple_union_id_to_tuple_union,
+    _tuple_union_to_tuple_union,
+)
 from beartype._check.convert.convcoerce import _hint_repr_to_hint
 from beartype._check.forward.reference.fwdrefmake import (
     _forwardref_args_to_forwardref)
@@ -34,6 +38,12 @@ def clear_checker_caches() -> None:
     * The **forward reference referee cache** (i.e., private
       :data:`beartype._check.forward.reference.fwdrefmeta._forwardref_to_referee`
       dictionary).
+    * The **relative forward reference placeholder cache** (i.e., private
+      :data:`beartype._check.code.codescope._ref_name_to_ref_placeholder`
+      dictionary).
+    * The **tuple union identity cache** (i.e., private
+      :data:`beartype._check.code.codescope._tuple_union_id_to_tuple_union`
+      dictionary).
     * The **tuple union cache** (i.e., private
       :data:`beartype._check.code.codescope._tuple_union_to_tuple_union`
       dictionary).
@@ -46,4 +56,6 @@ def clear_checker_caches() -> None:
     _forwardref_to_referee.clear()
     _forwardref_args_to_forwardref.clear()
     _hint_repr_to_hint.clear()
+    _ref_name_to_ref_placeholder.clear()
+    _tuple_union_id_to_tuple_union.clear()
     _tuple_union_to_tuple_union.clear()
@@ -141,11 +141,17 @@ the current pith either by a prior assignment statement or expression).
 '''
 
 
-HINT_META_INDEX_INDENT = next(__hint_meta_index_counter)
+HINT_META_INDEX_INDENT_LEVEL = next(__hint_meta_index_counter)
 '''
-0-based index into each tuple of hint metadata providing **current
-indentation** (i.e., Python code snippet expanding to the current level of
+0-based index into each tuple of hint metadata providing **current indentation
+level** (i.e., 1-based positive integer identifying the current level of
 indentation appropriate for the currently visited hint).
+
+This level is intentionally stored as an integer rather than as the Python code
+snippet expanding to this level of indentation, enabling the latter to be
+efficiently retrieved from the
+:data:`beartype._data.code.datacodeindent.INDENT_LEVEL_TO_CODE` cache rather
+than inefficiently reformatted on visiting each hint.
 '''
 
 # Delete the above counter for safety and sanity in equal measure.
@@ -21,7 +21,10 @@ from beartype.roar import (
     BeartypeDecorHintPepUnsupportedException,
     BeartypeDecorHintPep593Exception,
 )
-from beartype.typing import Optional
+from beartype.typing import (
+    List,
+    Optional,
+)
 from beartype._cave._cavefast import TestableTypes
 from beartype._check.checkmagic import (
     ARG_NAME_CLS_STACK,
@@ -36,7 +39,7 @@ from beartype._check.code.codemagic import (
     HINT_META_INDEX_PLACEHOLDER,
     HINT_META_INDEX_PITH_EXPR,
     HINT_META_INDEX_PITH_VAR_NAME,
-    HINT_META_INDEX_INDENT,
+    HINT_META_INDEX_INDENT_LEVEL,
 )
 from beartype._check.code.codescope import (
     add_func_scope_type,
@@ -44,6 +47,8 @@ from beartype._check.code.codescope import (
     add_func_scope_type_or_types,
     express_func_scope_type_ref,
 )
+from beartype._check.code.snip.codesnipcls import (
+    HINT_CHILD_INDEX_TO_PLACEHOLDER)
 from beartype._check.code.snip.codesnipstr import (
     PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX,
     PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX,
@@ -74,10 +79,7 @@ from beartype._check.code.snip.codesnipstr import (
 )
 from beartype._check.convert.convsanify import sanify_hint_any
 from beartype._conf.confcls import BeartypeConf
-from beartype._data.code.datacodeindent import (
-    CODE_INDENT_1,
-    CODE_INDENT_2,
-)
+from beartype._data.code.datacodeindent import INDENT_LEVEL_TO_CODE
 from beartype._data.code.datacodemagic import (
     LINE_RSTRIP_INDEX_AND,
     LINE_RSTRIP_INDEX_OR,
@@ -99,16 +101,12 @@ from beartype._data.hint.pep.sign.datapepsigns import (
 from beartype._data.hint.pep.sign.datapepsignset import (
     HINT_SIGNS_MAPPING,
     HINT_SIGNS_SEQUENCE_ARGS_1,
+    HINT_SIGNS_SUPPORTED,
     HINT_SIGNS_SUPPORTED_DEEP,
     HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
     HINT_SIGNS_UNION,
 )
 from beartype._util.cache.utilcachecall import callable_cached
-from beartype._util.cache.pool.utilcachepoollistfixed import (
-    FIXED_LIST_SIZE_MEDIUM,
-    acquire_fixed_list,
-    release_fixed_list,
-)
 from beartype._util.cache.pool.utilcachepoolobjecttyped import (
     acquire_object_typed,
     release_object_typed,
@@ -135,9 +133,8 @@ from beartype._util.hint.pep.proposal.utilpep593 import (
 )
 from beartype._util.hint.pep.utilpepget import (
     get_hint_pep_args,
-    get_hint_pep_sign,
+    get_hint_pep_origin_or_none,
     get_hint_pep_sign_or_none,
-    get_hint_pep_origin_type_isinstanceable,
 )
 from beartype._util.hint.pep.utilpeptest import (
     die_if_hint_pep_unsupported,
@@ -147,10 +144,42 @@ from beartype._util.hint.pep.utilpeptest import (
 )
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.kind.map.utilmapset import update_mapping
-from beartype._util.text.utiltextmunge import replace_str_substrs
 from beartype._util.text.utiltextrepr import represent_object
 from collections.abc import Callable
 from random import getrandbits
+from re import (
+    compile as re_compile,
+    escape as re_escape,
+)
+
+# ....................{ PRIVATE ~ globals                  }....................
+_HINT_CHILD_PLACEHOLDER_REGEX = re_compile(
+    f'{re_escape(PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX)}'
+    r'(\d+)'
+    f'{re_escape(PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX)}'
+)
+'''
+Compiled regular expression matching each **placeholder hint child
+type-checking substring** (i.e., placeholder to be replaced by a Python code
+snippet type-checking the current pith expression against the currently
+iterated child hint of the currently visited parent hint), capturing the
+0-based index of the metadata describing that child hint in the ``hints_meta``
+list maintained by the :func:`.make_check_expr` factory as this expression's
+first group.
+'''
+
+
+# Assert the "HINT_META_INDEX_*" indices to be ordered as expected by the tuple
+# unpacking localizing hint metadata in the make_check_expr() factory. Since
+# these indices are constants, validating their order once here avoids
+# revalidating that order for each hint visited by that factory.
+assert (
+    HINT_META_INDEX_HINT,
+    HINT_META_INDEX_PLACEHOLDER,
+    HINT_META_INDEX_PITH_EXPR,
+    HINT_META_INDEX_PITH_VAR_NAME,
+    HINT_META_INDEX_INDENT_LEVEL,
+) == (0, 1, 2, 3, 4), 'Hint metadata indices unordered.'
 
 # ....................{ MAKERS                             }....................
 @callable_cached
@@ -168,27 +197,30 @@ def make_check_expr(
     # *fight me, github developer community*
 
     # "beartype._check.checkmagic" globals.
-    _CODE_INDENT_1=CODE_INDENT_1,
-    _CODE_INDENT_2=CODE_INDENT_2,
     _EXCEPTION_PREFIX=EXCEPTION_PLACEHOLDER,
     _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
     _EXCEPTION_PREFIX_HINT=EXCEPTION_PREFIX_HINT,
 
     # "beartype._check.code.codemagic" globals.
-    _HINT_META_INDEX_HINT=HINT_META_INDEX_HINT,
-    _HINT_META_INDEX_PLACEHOLDER=HINT_META_INDEX_PLACEHOLDER,
-    _HINT_META_INDEX_PITH_EXPR=HINT_META_INDEX_PITH_EXPR,
-    _HINT_META_INDEX_PITH_VAR_NAME=HINT_META_INDEX_PITH_VAR_NAME,
-    _HINT_META_INDEX_INDENT=HINT_META_INDEX_INDENT,
     _LINE_RSTRIP_INDEX_AND=LINE_RSTRIP_INDEX_AND,
     _LINE_RSTRIP_INDEX_OR=LINE_RSTRIP_INDEX_OR,
 
+    # "beartype._check.code.snip.codesnipcls" globals.
+    _HINT_CHILD_INDEX_TO_PLACEHOLDER=HINT_CHILD_INDEX_TO_PLACEHOLDER,
+
+    # "beartype._data.code.datacodeindent" globals.
+    _INDENT_LEVEL_TO_CODE=INDENT_LEVEL_TO_CODE,
+
+    # "beartype._check.code.codemake" globals.
+    _HINT_CHILD_PLACEHOLDER_SUB: Callable = _HINT_CHILD_PLACEHOLDER_REGEX.sub,
+
+    # "beartype._check.code.snip.codesnipstr" string globals required only as
+    # positional "%"-style templates.
+    _PEP_CODE_PITH_ASSIGN_EXPR=PEP_CODE_PITH_ASSIGN_EXPR,
+    _PEP484_CODE_HINT_INSTANCE=PEP484_CODE_HINT_INSTANCE,
+
     # "beartype._check.code.snip.codesnipstr" string globals required only for their
     # bound str.format() methods.
-    PEP_CODE_PITH_ASSIGN_EXPR_format: Callable = (
-        PEP_CODE_PITH_ASSIGN_EXPR.format),
-    PEP484_CODE_HINT_INSTANCE_format: Callable = (
-        PEP484_CODE_HINT_INSTANCE.format),
     PEP484585_CODE_HINT_GENERIC_CHILD_format: Callable = (
         PEP484585_CODE_HINT_GENERIC_CHILD.format),
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1_format: Callable = (
@@ -351,9 +383,12 @@ def make_check_expr(
     #   the left-hand side (LHS) of that assignment expression).
     pith_curr_var_name = VAR_NAME_PITH_ROOT
 
+    # 1-based level of indentation appropriate for the currently visited hint.
+    indent_level_curr = 2
+
     # Python code snippet expanding to the current level of indentation
     # appropriate for the currently visited hint.
-    indent_curr = _CODE_INDENT_2
+    indent_curr: str = None  # type: ignore[assignment]
 
     # ..................{ HINT ~ child                       }..................
     # Currently iterated PEP-compliant child hint subscripting the currently
@@ -365,35 +400,25 @@ def make_check_expr(
     # (e.g., "Union" if "hint_child == Union[int, str]").
     hint_child_sign = None
 
+    # 1-based level of indentation appropriate for the currently iterated
+    # child hint, initialized to the root hint indentation level to enable the
+    # subsequently called _enqueue_hint_child() function to enqueue the root
+    # hint.
+    indent_level_child = indent_level_curr
+
     # Python code snippet expanding to the current level of indentation
-    # appropriate for the currently iterated child hint, initialized to the
-    # root hint indentation to enable the subsequently called
-    # _enqueue_hint_child() function to enqueue the root hint.
-    indent_child = indent_curr
+    # appropriate for the currently iterated child hint.
+    indent_child: str = None  # type: ignore[assignment]
 
     # ..................{ HINT ~ childs                      }..................
     # Current tuple of all PEP-compliant child hints subscripting the currently
     # visited hint (e.g., "(int, str)" if "hint_curr == Union[int, str]").
     hint_childs: tuple = None  # type: ignore[assignment]
 
-    # Current list of all output PEP-compliant child hints to replace the
-    # Current tuple of all input PEP-compliant child hints subscripting the
-    # currently visited hint with.
-    hint_childs_new: list = None  # type: ignore[assignment]
-
     # Number of PEP-compliant child hints subscripting the currently visited
     # hint.
     hint_childs_len: int = None  # type: ignore[assignment]
 
-    # 0-based index of the currently iterated PEP-compliant child hint of the
-    # "hint_childs" tuple.
-    hint_childs_index: int = None  # type: ignore[assignment]
-
-    # Current tuple of all PEP-compliant child child hints subscripting the
-    # currently visited child hint (e.g., "(int, str)" if "hint_child ==
-    # Union[int, str]").
-    hint_child_childs: tuple = None  # type: ignore[assignment]
-
     # ..................{ HINT ~ pep 484 : forwardref        }..................
     # Set of the unqualified classnames referred to by all relative forward
     # references visitable from this root hint if any *OR* "None" otherwise
@@ -473,25 +498,25 @@ def make_check_expr(
     pith_curr_assign_expr: str = None  # type: ignore[assignment]
 
     # ..................{ METADATA                           }..................
-    # Tuple of metadata describing the currently visited hint, appended by
-    # the previously visited parent hint to the "hints_meta" stack.
-    hint_curr_meta: tuple = None  # type: ignore[assignment]
-
-    # Fixed list of all metadata describing all visitable hints currently
-    # discovered by the breadth-first search (BFS) below. This list acts as a
-    # standard First In First Out (FILO) queue, enabling this BFS to be
-    # implemented as an efficient imperative algorithm rather than an
-    # inefficient (and dangerous, due to both unavoidable stack exhaustion and
-    # avoidable infinite recursion) recursive algorithm.
+    # List of all metadata describing all visitable hints currently discovered
+    # by the breadth-first search (BFS) below. This list acts as a standard
+    # First In First Out (FIFO) queue, enabling this BFS to be implemented as
+    # an efficient imperative algorithm rather than an inefficient (and
+    # dangerous, due to both unavoidable stack exhaustion and avoidable
+    # infinite recursion) recursive algorithm.
     #
-    # Note that this list is guaranteed by the previously called
-    # _die_if_hint_repr_exceeds_child_limit() function to be larger than the
-    # number of hints transitively visitable from this root hint. Ergo, *ALL*
-    # indexation into this list performed by this BFS is guaranteed to be safe.
-    # Ergo, avoid explicitly testing below that the "hints_meta_index_last"
-    # integer maintained by this BFS is strictly less than "FIXED_LIST_SIZE_MEDIUM", as this
-    # constraint is already guaranteed to be the case.
-    hints_meta = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
+    # Note that this list is intentionally a standard list dynamically grown
+    # by appending rather than a fixed list acquired from the fixed list pool.
+    # Since this function is memoized, this list is created only once per
+    # unique root hint. Moreover, most hints transitively visit only a handful
+    # of child hints. A pooled fixed list would thus be both larger than
+    # required in the common case *AND* smaller than required in the uncommon
+    # case of hints transitively visiting more child hints than that fixed
+    # list has items.
+    hints_meta: List[tuple] = []
+
+    # append() method of this list, localized for efficiency.
+    hints_meta_append = hints_meta.append
 
     # 0-based index of metadata describing the currently visited hint in the
     # "hints_meta" list.
@@ -500,13 +525,22 @@ def make_check_expr(
     # 0-based index of metadata describing the last visitable hint in the
     # "hints_meta" list, initialized to "-1" to ensure that the initial
     # incrementation of this index by the _enqueue_hint_child() directly called
-    # below initializes index 0 of the "hints_meta" fixed list.
+    # below initializes index 0 of the "hints_meta" list.
     #
     # For efficiency, this integer also uniquely identifies the currently
     # iterated child PEP-compliant type hint of the currently visited parent
     # PEP-compliant type hint.
     hints_meta_index_last = -1
 
+    # List of all Python code snippets type-checking all hints visited by the
+    # breadth-first search (BFS) below, such that the item at each index of
+    # this list is the snippet type-checking the hint described by the
+    # metadata at the same index of the "hints_meta" list. Each such snippet
+    # embeds the placeholders of its child hints as is, deferring the
+    # replacement of these placeholders by these child snippets until *AFTER*
+    # this BFS has visited all hints. See "CODE ~ stitch" below.
+    hints_code: List[str] = []
+
     # ..................{ FUNC ~ code                        }..................
     # Python code snippet type-checking the current pith against the currently
     # visited hint (to be appended to the "func_wrapper_code" string).
@@ -560,11 +594,8 @@ def make_check_expr(
 
         # Increment both the 0-based index of metadata describing the last
         # visitable hint in the "hints_meta" list and the unique identifier of
-        # the currently iterated child hint *BEFORE* overwriting the existing
-        # metadata at this index.
-        #
-        # Note this index is guaranteed to *NOT* exceed the fixed length of
-        # this list, by prior validation.
+        # the currently iterated child hint *BEFORE* appending metadata
+        # describing that hint.
         hints_meta_index_last += 1
 
         # Placeholder string to be globally replaced by code type-checking the
@@ -582,25 +613,21 @@ def make_check_expr(
         #   ambiguously overlap with the subsequent substring "10" generated by
         #   this method, which would then produce catastrophically erroneous
         #   and undebuggable Python code.
-        hint_child_placeholder = (
-            f'{PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX}'
-            f'{str(hints_meta_index_last)}'
-            f'{PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
-        )
-
-        # Create and insert a new tuple of metadata describing this child hint
-        # at this index of this list.
         #
-        # Note that this assignment is guaranteed to be safe, as
-        # "FIXED_LIST_SIZE_MEDIUM" is guaranteed to be substantially larger than
-        # "hints_meta_index_last".
-        hints_meta[hints_meta_index_last] = (
+        # Note that this string is efficiently retrieved from a cache of such
+        # strings rather than inefficiently reformatted here.
+        hint_child_placeholder = _HINT_CHILD_INDEX_TO_PLACEHOLDER[
+            hints_meta_index_last]
+
+        # Create and append a new tuple of metadata describing this child hint
+        # to this list, which then resides at this index of this list.
+        hints_meta_append((
             hint_child,
             hint_child_placeholder,
             pith_child_expr,
             pith_curr_var_name,
-            indent_child,
-        )
+            indent_level_child,
+        ))
 
         # Return this placeholder string.
         return hint_child_placeholder
@@ -621,35 +648,32 @@ def make_check_expr(
     # function to validate this code to be valid *BEFORE* returning this code.
     func_root_code = hint_child_placeholder
 
-    # Python code snippet to be returned, seeded with a placeholder to be
-    # replaced on the first iteration of the breadth-first search performed
-    # below with a snippet type-checking the root pith against the root hint.
-    func_wrapper_code = func_root_code
-
     # ..................{ SEARCH                             }..................
     # While the 0-based index of metadata describing the next visited hint in
     # the "hints_meta" list does *NOT* exceed that describing the last
     # visitable hint in this list, there remains at least one hint to be
     # visited in the breadth-first search performed by this iteration.
     while hints_meta_index_curr <= hints_meta_index_last:
-        # Metadata describing the currently visited hint.
-        hint_curr_meta = hints_meta[hints_meta_index_curr]
-
-        # Assert this metadata is a tuple as expected. This enables us to
-        # distinguish between proper access of used items and improper access
-        # of unused items of the parent fixed list containing this tuple, since
-        # an unused item of this list is initialized to "None" by default.
-        assert hint_curr_meta.__class__ is tuple, (
-            f'Current hint metadata {repr(hint_curr_meta)} at '
-            f'index {hints_meta_index_curr} not tuple.')
-
-        #FIXME: [SPEED] Optimize by reducing to a single tuple unpacking.
-        # Localize metadatum for both efficiency and f-string purposes.
-        hint_curr             = hint_curr_meta[_HINT_META_INDEX_HINT]
-        hint_curr_placeholder = hint_curr_meta[_HINT_META_INDEX_PLACEHOLDER]
-        pith_curr_expr        = hint_curr_meta[_HINT_META_INDEX_PITH_EXPR]
-        pith_curr_var_name    = hint_curr_meta[_HINT_META_INDEX_PITH_VAR_NAME]
-        indent_curr           = hint_curr_meta[_HINT_META_INDEX_INDENT]
+        # Localize metadatum describing the currently visited hint for both
+        # efficiency and f-string purposes.
+        #
+        # Note that this metadata is intentionally localized by a single tuple
+        # unpacking rather than by individually indexing each metadatum via
+        # the "HINT_META_INDEX_*" indices. The former reduces to a single
+        # UNPACK_SEQUENCE bytecode specialized for tuples and is roughly twice
+        # as fast as the five BINARY_SUBSCR bytecodes required by the latter.
+        # Since this unpacking implicitly assumes the order of these indices,
+        # that order is validated once at module scope above rather than on
+        # each iteration of this loop. Likewise, this metadata is guaranteed to
+        # be a tuple, as the _enqueue_hint_child() closure is the only source
+        # of this metadata.
+        (
+            hint_curr,
+            hint_curr_placeholder,
+            pith_curr_expr,
+            pith_curr_var_name,
+            indent_level_curr,
+        ) = hints_meta[hints_meta_index_curr]
         # print(f'Visiting type hint {repr(hint_curr)}...')
 
         # If this is a child hint rather than the root hint, sanify (i.e.,
@@ -676,8 +700,18 @@ def make_check_expr(
         #         hint_curr_exception_prefix, hint, hint_curr_placeholder, func_wrapper_code))
 
         # ................{ PEP                                }................
+        # Sign uniquely identifying this hint if this hint is PEP-compliant *OR*
+        # "None" otherwise.
+        #
+        # Note that this getter is called rather than the is_hint_pep() tester
+        # followed by the get_hint_pep_sign() getter. Since the former tester
+        # reduces to this getter, doing so halves the number of calls required
+        # to both detect *AND* identify each visited PEP-compliant hint.
+        hint_curr_sign = get_hint_pep_sign_or_none(hint_curr)
+        # print(f'Visiting type hint {repr(hint_curr)} sign {repr(hint_curr_sign)}...')
+
         # If this hint is PEP-compliant...
-        if is_hint_pep(hint_curr):
+        if hint_curr_sign is not None:
             #FIXME: Refactor to call warn_if_hint_pep_unsupported() instead.
             #Actually...wait. This is probably still a valid test here. We'll
             #need to instead augment the is_hint_ignorable() function to
@@ -695,13 +729,20 @@ def make_check_expr(
 
             # If this hint is currently unsupported, raise an exception.
             #
+            # Note that this validator is called *ONLY* if this sign is
+            # unsupported. Since this validator trivially reduces to the same
+            # test against the same frozen set on success, deferring to this
+            # validator *ONLY* on failure avoids a redundant function call (and
+            # keyword argument packing) for each supported hint visited below.
+            #
             # Note the human-readable label prefixing the representations of
             # child PEP-compliant type hints is unconditionally passed. Since
             # the root hint has already been validated to be supported by
             # the above call to the same function, this call is guaranteed to
             # *NEVER* raise an exception for that hint.
-            die_if_hint_pep_unsupported(
-                hint=hint_curr, exception_prefix=_EXCEPTION_PREFIX)
+            if hint_curr_sign not in HINT_SIGNS_SUPPORTED:
+                die_if_hint_pep_unsupported(
+                    hint=hint_curr, exception_prefix=_EXCEPTION_PREFIX)
             # Else, this hint is supported.
 
             # Assert that this hint is unignorable. Iteration below generating
@@ -714,10 +755,6 @@ def make_check_expr(
                 f'{_EXCEPTION_PREFIX}ignorable type hint '
                 f'{repr(hint_curr)} not ignored.')
 
-            # Sign uniquely identifying this hint.
-            hint_curr_sign = get_hint_pep_sign(hint_curr)
-            # print(f'Visiting PEP type hint {repr(hint_curr)} sign {repr(hint_curr_sign)}...')
-
             # If this hint is deprecated, emit a non-fatal warning.
             # print(f'Testing {hint_curr_exception_prefix} hint {repr(hint_curr)} for deprecation...')
             warn_if_hint_pep_deprecated(
@@ -814,19 +851,26 @@ def make_check_expr(
             # Then generate trivial code shallowly type-checking the current
             # pith as an instance of the origin type originating this sign
             # (e.g., "list" for the hint "typing.List[int]").
-                # Code type-checking the current pith against this origin type.
-                func_curr_code = PEP484_CODE_HINT_INSTANCE_format(
-                    pith_curr_expr=pith_curr_expr,
-                    # Python expression evaluating to this origin type.
-                    hint_curr_expr=add_func_scope_type(
-                        # Origin type of this hint if any *OR* raise an
-                        # exception -- which should *NEVER* happen, as this hint
-                        # was validated above to be supported.
-                        cls=get_hint_pep_origin_type_isinstanceable(hint_curr),
-                        func_scope=func_wrapper_scope,
-                        exception_prefix=_EXCEPTION_PREFIX_HINT,
-                    ),
+                # Python expression evaluating to this origin type.
+                hint_curr_expr = add_func_scope_type(
+                    # Origin type of this hint.
+                    #
+                    # Note that the lower-level get_hint_pep_origin_or_none()
+                    # getter is intentionally called rather than the
+                    # higher-level get_hint_pep_origin_type_isinstanceable()
+                    # getter, which redundantly refetches the sign of this hint
+                    # and retests that sign against the same frozen set tested
+                    # above. Since this adder already validates this origin to
+                    # be an isinstanceable type, doing so sacrifices *NO*
+                    # safety.
+                    cls=get_hint_pep_origin_or_none(hint_curr),
+                    func_scope=func_wrapper_scope,
+                    exception_prefix=_EXCEPTION_PREFIX_HINT,
                 )
+
+                # Code type-checking the current pith against this origin type.
+                func_curr_code = _PEP484_CODE_HINT_INSTANCE % (
+                    pith_curr_expr, hint_curr_expr)
             # Else, this hint is either subscripted, not shallowly
             # type-checkable, *OR* deeply type-checkable.
             #
@@ -853,10 +897,8 @@ def make_check_expr(
                     ))
 
                 # Code type-checking the current pith against this class.
-                func_curr_code = PEP484_CODE_HINT_INSTANCE_format(
-                    pith_curr_expr=pith_curr_expr,
-                    hint_curr_expr=hint_curr_expr,
-                )
+                func_curr_code = _PEP484_CODE_HINT_INSTANCE % (
+                    pith_curr_expr, hint_curr_expr)
             # Else, this hint is *NOT* a forward reference.
             #
             # Since this hint is *NOT* shallowly type-checkable, this hint
@@ -866,39 +908,19 @@ def make_check_expr(
             # Perform deep type-checking logic (i.e., logic that is guaranteed
             # to recurse and thus *NOT* "bottom out" at this hint).
             else:
-                #FIXME: Horribly inefficient. Performing this string formatting
-                #over and over again is needlessly awful. Instead:
-                #* Define a new "INDENT_INDEX_TO_STR" dictionary global in the
-                #  "codesnip" submodule. Implement this dictionary dynamically
-                #  via the __missing__() method to dynamically generate
-                #  indentation prefixes as needed: e.g.,
-                #      class IndentIndexToStr(dict):
-                #          def __missing__(self, indent_index: int) -> str:
-                #              assert isinstance(indent_index, int)
-                #              assert indent_index > 0
-                #              return '    ' * indent_index
-                #
-                #      #FIXME: Unit test us up, please.
-                #      INDENT_INDEX_TO_STR = IndentIndexToStr()
-                #* Define a new "indent_index_curr" local above as a positive
-                #  integer, defaulting to:
-                #      indent_index_curr = 2
-                #* Preserve "indent_child" as is.
-                #* Set "indent_child" here as follows:
-                #      index_child = INDENT_INDEX_TO_STR[indent_index_curr + 1]
-                #
-                #Cool, huh? Yeah. We thought so, too. We've literally replaced
-                #inefficient string formatting with efficient dictionary
-                #lookups, which are themselves efficiently cached. \o/
-
-                # Python code snippet expanding to the current level of
-                # indentation appropriate for the current child hint.
+                # Python code snippets expanding to the current levels of
+                # indentation appropriate for both the current hint and the
+                # current child hint, efficiently retrieved from a cache of
+                # such snippets rather than inefficiently reformatted here.
                 #
-                # Note that this is almost always but technically *NOT* always
-                # required below by logic generating code type-checking the
-                # currently visited parent hint. Naturally, unconditionally
-                # setting this string here trivially optimizes the common case.
-                indent_child = f'{indent_curr}{_CODE_INDENT_1}'
+                # Note that these snippets are almost always but technically
+                # *NOT* always required below by logic generating code
+                # type-checking the currently visited parent hint. Naturally,
+                # unconditionally setting these snippets here trivially
+                # optimizes the common case.
+                indent_curr = _INDENT_LEVEL_TO_CODE[indent_level_curr]
+                indent_level_child = indent_level_curr + 1
+                indent_child = _INDENT_LEVEL_TO_CODE[indent_level_child]
 
                 # ............{ DEEP ~ expression                  }............
                 #FIXME: Unit test that this is behaving as expected. Doing so
@@ -1106,10 +1128,8 @@ def make_check_expr(
 
                     # Assignment expression assigning this full expression to
                     # this variable.
-                    pith_curr_assign_expr = PEP_CODE_PITH_ASSIGN_EXPR_format(
-                        pith_curr_var_name=pith_curr_var_name,
-                        pith_curr_expr=pith_curr_expr,
-                    )
+                    pith_curr_assign_expr = _PEP_CODE_PITH_ASSIGN_EXPR % (
+                        pith_curr_var_name, pith_curr_expr)
                 # Else, one or more of the above conditions have *NOT* been
                 # satisfied. In this case, preserve the Python code snippet
                 # evaluating to the current pith as is.
@@ -1164,32 +1184,41 @@ def make_check_expr(
                     #     >>> typing.Union[int]
                     #     int
 
-                    # 0-based index of the currently iterated child hint.
-                    hint_childs_index = 0
+                    # For efficiency, reuse previously created sets of the
+                    # following (when available):
+                    # * "hint_childs_nonpep", the set of all PEP-noncompliant
+                    #   child hints subscripting this union.
+                    # * "hint_childs_pep", the set of all PEP-compliant child
+                    #   hints subscripting this union.
+                    #
+                    # Since these child hints require fundamentally different
+                    # forms of type-checking, prefiltering child hints into
+                    # these sets *BEFORE* generating code type-checking these
+                    # child hints improves both efficiency and maintainability.
+                    hint_childs_nonpep = acquire_object_typed(set)
+                    hint_childs_pep = acquire_object_typed(set)
 
-                    # For efficiency, reuse a previously created list of all
-                    # new child hints of this parent union.
-                    hint_childs_new = acquire_object_typed(list)
-                    hint_childs_new.clear()
+                    # Clear these sets prior to use below.
+                    hint_childs_nonpep.clear()
+                    hint_childs_pep.clear()
 
-                    # For each subscripted argument of this union...
+                    # For each subscripted argument of this union, sanify this
+                    # argument, flatten this argument if this argument is itself
+                    # a union, and filter this argument into one of these sets.
                     #
-                    # Note that this preliminary iteration:
-                    # * Modifies the "hint_childs" container being iterated over
-                    #   and is thus intentionally implemented as a cumbersome
-                    #   "while" loop rather than a convenient "for" loop.
-                    # * Exists for the sole purpose of explicitly flattening
-                    #   *ALL* child unions nested in this parent union. This
-                    #   iteration *CANNOT* be efficiently combined with the
-                    #   iteration performed below for that reason.
+                    # Note that this iteration:
+                    # * Intentionally performs all of these operations in a
+                    #   single pass rather than flattening this union in a
+                    #   preliminary pass and then filtering the flattened union
+                    #   in a subsequent pass. Doing so avoids both an
+                    #   intermediate list of flattened child hints *AND* a
+                    #   redundant call to the is_hint_pep() tester for each
+                    #   child hint, whose sign is already known here.
                     # * Does *NOT* recursively flatten arbitrarily nested
                     #   child unions regardless of nesting depth in this parent
                     #   union. Doing so is non-trivial and currently *NOT*
                     #   required by any existing edge cases. "Huzzah!"
-                    while hint_childs_index < hint_childs_len:
-                        # Current child hint of this union.
-                        hint_child = hint_childs[hint_childs_index]
-
+                    for hint_child in hint_childs:
                         # This child hint sanified (i.e., sanitized) from this
                         # child hint if this child hint is reducible *OR*
                         # preserved as is otherwise (i.e., if this child hint is
@@ -1221,66 +1250,6 @@ def make_check_expr(
                         # hint is PEP-noncompliant).
                         hint_child_sign = get_hint_pep_sign_or_none(hint_child)
 
-                        # If this child hint is itself a child union nested in
-                        # this parent union, explicitly flatten this nested
-                        # union by appending *ALL* child child hints
-                        # subscripting this child union onto this parent union.
-                        #
-                        # Note that this edge case currently *ONLY* arises when
-                        # this child hint has been expanded by the above call to
-                        # the sanify_hint_any() function from a non-union (e.g.,
-                        # "float") into a union (e.g., "float | int"). The
-                        # standard PEP 484-compliant "typing.Union" factory
-                        # already implicitly flattens nested unions: e.g.,
-                        #     >>> from typing import Union
-                        #     >>> Union[float, Union[int, str]]
-                        #     typing.Union[float, int, str]
-                        if hint_child_sign in HINT_SIGNS_UNION:
-                            # Tuple of all child child type hints subscripting
-                            # this child union.
-                            hint_child_childs = get_hint_pep_args(hint_child)
-                            # print(f'Expanding union {repr(hint_curr)} with child union {repr(hint_child_childs)}...')
-
-                            # Append these child child type hints to this parent
-                            # union.
-                            hint_childs_new.extend(hint_child_childs)
-                        # Else, this child hint is *NOT* itself a union. In this
-                        # case, append this child hint to this parent union.
-                        else:
-                            hint_childs_new.append(hint_child)
-
-                        # Increment the 0-based index of the currently iterated
-                        # child hint.
-                        hint_childs_index += 1
-
-                    # Freeze this temporary list back to this permanent tuple,
-                    # replacing the prior unflattened contents of this tuple.
-                    hint_childs = tuple(hint_childs_new)
-
-                    # Release this list back to its respective pool.
-                    release_object_typed(hint_childs_new)
-                    # print(f'Flattened union to {repr(hint_childs)}...')
-
-                    # For efficiency, reuse previously created sets of the
-                    # following (when available):
-                    # * "hint_childs_nonpep", the set of all PEP-noncompliant
-                    #   child hints subscripting this union.
-                    # * "hint_childs_pep", the set of all PEP-compliant child
-                    #   hints subscripting this union.
-                    #
-                    # Since these child hints require fundamentally different
-                    # forms of type-checking, prefiltering child hints into
-                    # these sets *BEFORE* generating code type-checking these
-                    # child hints improves both efficiency and maintainability.
-                    hint_childs_nonpep = acquire_object_typed(set)
-                    hint_childs_pep = acquire_object_typed(set)
-
-                    # Clear these sets prior to use below.
-                    hint_childs_nonpep.clear()
-                    hint_childs_pep.clear()
-
-                    # For each subscripted argument of this union...
-                    for hint_child in hint_childs:
                         #FIXME: Uncomment as desired for debugging. This test is
                         #currently a bit too costly to warrant uncommenting.
                         # Assert that this child hint is *NOT* shallowly ignorable.
@@ -1294,29 +1263,62 @@ def make_check_expr(
                         #     f'{hint_curr_exception_prefix} {repr(hint_curr)} child '
                         #     f'{repr(hint_child)} ignorable but not ignored.')
 
-                        # If this child hint is PEP-compliant...
-                        if is_hint_pep(hint_child):
-                            # Filter this child hint into the set of
-                            # PEP-compliant child hints.
-                            #
-                            # Note that this PEP-compliant child hint *CANNOT*
-                            # also be filtered into the set of PEP-noncompliant
-                            # child hints, even if this child hint originates
-                            # from a non-"typing" type (e.g., "List[int]" from
-                            # "list"). Why? Because that would then induce
-                            # false positives when the current pith shallowly
-                            # satisfies this non-"typing" type but does *NOT*
-                            # deeply satisfy this child hint.
-                            hint_childs_pep.add(hint_child)
-                        # Else, this child hint is PEP-noncompliant. In this
-                        # case, filter this child hint into the list of
-                        # PEP-noncompliant arguments.
-                        else:
+                        # If this child hint is PEP-noncompliant, filter this
+                        # child hint into the set of PEP-noncompliant child
+                        # hints.
+                        if hint_child_sign is None:
                             hint_childs_nonpep.add(hint_child)
+                        # Else, this child hint is PEP-compliant.
+                        #
+                        # If this child hint is itself a child union nested in
+                        # this parent union, explicitly flatten this nested
+                        # union by filtering *ALL* child child hints
+                        # subscripting this child union into these sets.
+                        #
+                        # Note that this edge case currently *ONLY* arises when
+                        # this child hint has been expanded by the above call to
+                        # the sanify_hint_any() function from a non-union (e.g.,
+                        # "float") into a union (e.g., "float | int"). The
+                        # standard PEP 484-compliant "typing.Union" factory
+                        # already implicitly flattens nested unions: e.g.,
+                        #     >>> from typing import Union
+                        #     >>> Union[float, Union[int, str]]
+                        #     typing.Union[float, int, str]
+                        elif hint_child_sign in HINT_SIGNS_UNION:
+                            # print(f'Expanding union {repr(hint_curr)} with child union {repr(hint_child)}...')
+                            # For each child child hint subscripting this child
+                            # union...
+                            for hint_child_child in get_hint_pep_args(
+                                hint_child):
+                                # Filter this child child hint into the
+                                # appropriate set, as above.
+                                if is_hint_pep(hint_child_child):
+                                    hint_childs_pep.add(hint_child_child)
+                                else:
+                                    hint_childs_nonpep.add(hint_child_child)
+                        # Else, this child hint is a PEP-compliant non-union.
+                        # In this case, filter this child hint into the set of
+                        # PEP-compliant child hints.
+                        #
+                        # Note that this PEP-compliant child hint *CANNOT* also
+                        # be filtered into the set of PEP-noncompliant child
+                        # hints, even if this child hint originates from a
+                        # non-"typing" type (e.g., "List[int]" from "list").
+                        # Why? Because that would then induce false positives
+                        # when the current pith shallowly satisfies this
+                        # non-"typing" type but does *NOT* deeply satisfy this
+                        # child hint.
+                        else:
+                            hint_childs_pep.add(hint_child)
 
-                    # Initialize the code type-checking the current pith against
-                    # these arguments to the substring prefixing all such code.
-                    func_curr_code = PEP484_CODE_HINT_UNION_PREFIX
+                    # List of all code snippets type-checking the current pith
+                    # against these arguments, joined into a single snippet
+                    # below. Since the "+=" operator only reuses the buffer of
+                    # its left-hand string in the uncommon case that string is
+                    # referenced by *NO* other objects, appending to a list and
+                    # joining that list once avoids repeated string copies.
+                    hint_childs_code: List[str] = []
+                    hint_childs_code_append = hint_childs_code.append
 
                     # If this union is subscripted by one or more
                     # PEP-noncompliant child hints, generate and append
@@ -1324,7 +1326,7 @@ def make_check_expr(
                     # less efficient code type-checking any PEP-compliant child
                     # hints subscripting this union.
                     if hint_childs_nonpep:
-                        func_curr_code += (
+                        hint_childs_code_append(
                             PEP484_CODE_HINT_UNION_CHILD_NONPEP_format(
                                 # Python expression yielding the value of the
                                 # current pith. Specifically...
@@ -1350,25 +1352,14 @@ def make_check_expr(
                                 # Python expression evaluating to a tuple of
                                 # these arguments.
                                 #
-                                # Note that we would ideally avoid coercing this
-                                # set into a tuple when this set only contains
-                                # one type by passing that type directly to the
-                                # _add_func_wrapper_local_type() function.
-                                # Sadly, the "set" class defines no convenient
-                                # or efficient means of retrieving the only item
-                                # of a 1-set. Indeed, the most efficient means
-                                # of doing so is to iterate over that set and
-                                # break:
-                                #     for first_item in muh_set: break
-                                #
-                                # While we *COULD* technically leverage that
-                                # approach here, doing so would also mandate
-                                # adding multiple intermediate tests, mitigating
-                                # any performance gains. Ultimately, we avoid
-                                # doing so by falling back to the usual
-                                # approach. See also this relevant
-                                # self-StackOverflow post:
-                                #       https://stackoverflow.com/a/40054478/2809027
+                                # Note that this set is intentionally passed
+                                # as is rather than coerced into a tuple. If
+                                # this set only contains one type (e.g., the
+                                # common case of "Optional[T]"), this adder
+                                # registers only that type *WITHOUT* coercing
+                                # this set into a tuple, enabling the
+                                # generated isinstance() call to test that
+                                # type directly rather than a 1-tuple.
                                 hint_curr_expr=add_func_scope_types(
                                     types=hint_childs_nonpep,
                                     func_scope=func_wrapper_scope,
@@ -1380,7 +1371,7 @@ def make_check_expr(
                     # and append code type-checking this child hint.
                     for hint_child_index, hint_child in enumerate(
                         hint_childs_pep):
-                        func_curr_code += (
+                        hint_childs_code_append(
                             PEP484_CODE_HINT_UNION_CHILD_PEP_format(
                                 # Python expression yielding the value of the
                                 # current pith.
@@ -1420,25 +1411,29 @@ def make_check_expr(
                                     pith_curr_assign_expr
                                 )))
 
-                    # If this code is *NOT* its initial value, this union is
-                    # subscripted by one or more unignorable child hints and
-                    # the above logic generated code type-checking these child
-                    # hints. In this case...
-                    if func_curr_code is not (
-                        PEP484_CODE_HINT_UNION_PREFIX):
+                    # If this list is non-empty, this union is subscripted by
+                    # one or more unignorable child hints and the above logic
+                    # generated code type-checking these child hints. In this
+                    # case...
+                    if hint_childs_code:
                         # Munge this code to...
                         func_curr_code = (
+                            # Prefix this code by the substring prefixing all
+                            # such code.
+                            f'{PEP484_CODE_HINT_UNION_PREFIX}'
                             # Strip the erroneous " or" suffix appended by the
                             # last child hint from this code.
-                            f'{func_curr_code[:_LINE_RSTRIP_INDEX_OR]}'
+                            f'{"".join(hint_childs_code)[:_LINE_RSTRIP_INDEX_OR]}'
                             # Suffix this code by the substring suffixing all
                             # such code.
                             f'{PEP484_CODE_HINT_UNION_SUFFIX}'
                         # Format the "indent_curr" prefix into this code
                             # deferred above for efficiency.
                         ).format(indent_curr=indent_curr)
-                    # Else, this snippet is its initial value and thus
-                    # ignorable.
+                    # Else, this list is empty. In this case, reduce this code
+                    # to the ignorable substring prefixing all such code.
+                    else:
+                        func_curr_code = PEP484_CODE_HINT_UNION_PREFIX
 
                     # Release this pair of sets back to their respective pools.
                     release_object_typed(hint_childs_nonpep)
@@ -1474,7 +1469,12 @@ def make_check_expr(
                     # sequence type hint.
                     hint_curr_expr = add_func_scope_type(
                         # Origin type of this sequence.
-                        cls=get_hint_pep_origin_type_isinstanceable(hint_curr),
+                        #
+                        # Note that the signs of all sequences handled here
+                        # are guaranteed to reside in the frozen set of signs
+                        # originating from isinstanceable types. See the
+                        # similar call above for further details.
+                        cls=get_hint_pep_origin_or_none(hint_curr),
                         func_scope=func_wrapper_scope,
                         exception_prefix=_EXCEPTION_PREFIX_HINT,
                     )
@@ -1523,10 +1523,8 @@ def make_check_expr(
                     # to trivial code shallowly type-checking this pith as an
                     # instance of this origin type.
                     else:
-                        func_curr_code = PEP484_CODE_HINT_INSTANCE_format(
-                            pith_curr_expr=pith_curr_expr,
-                            hint_curr_expr=hint_curr_expr,
-                        )
+                        func_curr_code = _PEP484_CODE_HINT_INSTANCE % (
+                            pith_curr_expr, hint_curr_expr)
                 # Else, this hint is neither a standard sequence *NOR* variadic
                 # tuple.
                 #
@@ -2010,16 +2008,16 @@ def make_check_expr(
         #   were the root type hint, it would have already been passed into a
         #   faster submodule generating PEP-noncompliant code instead.
         elif isinstance(hint_curr, type):
-            # Code type-checking the current pith against this type.
-            func_curr_code = PEP484_CODE_HINT_INSTANCE_format(
-                pith_curr_expr=pith_curr_expr,
-                # Python expression evaluating to this type.
-                hint_curr_expr=add_func_scope_type(
-                    cls=hint_curr,
-                    func_scope=func_wrapper_scope,
-                    exception_prefix=_EXCEPTION_PREFIX_HINT,
-                ),
+            # Python expression evaluating to this type.
+            hint_curr_expr = add_func_scope_type(
+                cls=hint_curr,
+                func_scope=func_wrapper_scope,
+                exception_prefix=_EXCEPTION_PREFIX_HINT,
             )
+
+            # Code type-checking the current pith against this type.
+            func_curr_code = _PEP484_CODE_HINT_INSTANCE % (
+                pith_curr_expr, hint_curr_expr)
         # ................{ NON-PEP ~ bad                      }................
         # Else, this hint is neither PEP-compliant *NOR* a class. In this case,
         # raise an exception. Note that:
@@ -2039,25 +2037,55 @@ def make_check_expr(
             )
 
         # ................{ CLEANUP                            }................
-        # Inject this code into the body of this wrapper.
-        func_wrapper_code = replace_str_substrs(
-            text=func_wrapper_code,
-            old=hint_curr_placeholder,
-            new=func_curr_code,
-        )
-
-        # Nullify the metadata describing the previously visited hint in this
-        # list for safety.
-        hints_meta[hints_meta_index_curr] = None
+        # Record this code for subsequent injection into the body of this
+        # wrapper *AFTER* visiting all hints.
+        #
+        # Note that this code is intentionally *NOT* injected into this body
+        # here by globally replacing this placeholder in this body. Doing so
+        # would rescan the entire body accumulated thus far on visiting each
+        # hint, which scales quadratically with the number of visited hints.
+        hints_code.append(func_curr_code)
 
         # Increment the 0-based index of metadata describing the next visited
         # hint in the "hints_meta" list *BEFORE* visiting that hint but *AFTER*
         # performing all other logic for the currently visited hint.
         hints_meta_index_curr += 1
 
-    # ..................{ CLEANUP                            }..................
-    # Release the fixed list of all such metadata.
-    release_fixed_list(hints_meta)
+    # ..................{ CODE ~ stitch                      }..................
+    def _get_hint_code(hint_child_placeholder_match) -> str:
+        '''
+        Python code snippet type-checking the child hint whose placeholder is
+        matched by the passed regular expression match, with all placeholders
+        of all transitive child hints of that hint recursively replaced by the
+        code snippets type-checking those hints.
+
+        Parameters
+        ----------
+        hint_child_placeholder_match : re.Match
+            Match of the :data:`._HINT_CHILD_PLACEHOLDER_REGEX` regular
+            expression against a placeholder in a parent code snippet.
+
+        Returns
+        -------
+        str
+            Python code snippet type-checking that child hint.
+        '''
+
+        # Recursively replace all placeholders in the code snippet
+        # type-checking this child hint. Since the recursion depth is bounded
+        # by the nesting depth of the root hint, this is safe.
+        return _HINT_CHILD_PLACEHOLDER_SUB(
+            _get_hint_code,
+            hints_code[int(hint_child_placeholder_match.group(1))],
+        )
+
+    # Inject the code type-checking all visited hints into the body of this
+    # wrapper by replacing the placeholder of the root hint in a single
+    # recursive pass. Since each placeholder is embedded exactly once in the
+    # code snippet type-checking its parent hint, each code snippet is scanned
+    # exactly once, reducing this injection to linear time.
+    func_wrapper_code = _HINT_CHILD_PLACEHOLDER_SUB(
+        _get_hint_code, func_root_code)
 
     # If the Python code snippet to be returned remains unchanged from its
     # initial value, the breadth-first search above failed to generate code. In
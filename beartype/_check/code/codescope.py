@@ -50,6 +50,7 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype.roar import BeartypeDecorHintNonpepException
 from beartype.typing import (
     Dict,
+    FrozenSet,
     Optional,
     Tuple,
 )
@@ -60,7 +61,10 @@ from beartype._check.code.snip.codesnipstr import (
     CODE_HINT_REF_TYPE_BASENAME_PLACEHOLDER_PREFIX,
     CODE_HINT_REF_TYPE_BASENAME_PLACEHOLDER_SUFFIX,
 )
-from beartype._data.cls.datacls import TYPES_SET_OR_TUPLE
+from beartype._data.cls.datacls import (
+    TYPE_BUILTIN_TO_NAME,
+    TYPES_SET,
+)
 from beartype._data.hint.datahinttyping import (
     LexicalScope,
     Pep484585ForwardRef,
@@ -71,13 +75,11 @@ from beartype._data.hint.datahinttyping import (
 from beartype._util.cls.pep.utilpep3119 import (
     die_unless_type_isinstanceable,
     die_unless_type_or_types_isinstanceable,
+    is_types_isinstanceable,
 )
-from beartype._util.cls.utilclstest import is_type_builtin
 from beartype._util.func.utilfuncscope import add_func_scope_attr
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585ref import (
     get_hint_pep484585_ref_names)
-from beartype._util.utilobject import get_object_type_basename
-from collections.abc import Set
 
 # ....................{ ADDERS ~ type                      }....................
 #FIXME: Unit test us up, please.
@@ -139,7 +141,6 @@ def add_func_scope_ref(
     return hint_ref_arg_name
 
 # ....................{ ADDERS ~ type                      }....................
-#FIXME: Unit test us up, please.
 def add_func_scope_type_or_types(
     # Mandatory parameters.
     func_scope: LexicalScope,
@@ -157,9 +158,9 @@ def add_func_scope_type_or_types(
     refer to the passed class or tuple of classes and whose value is that class
     or tuple) to the passed scope *and* return that name.
 
-    This function additionally caches this tuple with the beartypistry
-    singleton to reduce space consumption for tuples duplicated across the
-    active Python interpreter.
+    This function additionally caches this tuple with the private tuple union
+    cache to reduce space consumption for tuples duplicated across the active
+    Python interpreter.
 
     Parameters
     ----------
@@ -200,13 +201,18 @@ def add_func_scope_type_or_types(
     # Return either...
     return (
         # If this hint is a class, the name of a new parameter passing this
-        # class;
+        # class. For efficiency, this hint is first tested by identity against
+        # the root metaclass (i.e., the metaclass of most classes) *BEFORE*
+        # deferring to a slower isinstance() call handling other metaclasses;
         add_func_scope_type(
             func_scope=func_scope,
-            cls=type_or_types,
+            cls=type_or_types,  # type: ignore[arg-type]
             exception_prefix=exception_prefix,
         )
-        if isinstance(type_or_types, type) else
+        if (
+            type_or_types.__class__ is type or
+            isinstance(type_or_types, type)
+        ) else
         # Else, this hint is *NOT* a class. In this case:
         # * If this hint is a tuple of classes, the name of a new parameter
         #   passing this tuple.
@@ -263,21 +269,34 @@ def add_func_scope_type(
         as a private rather than public exception.
     '''
 
+    # Attempt to retrieve the unqualified basename of this type if this type is
+    # a builtin (i.e., globally accessible C-based type requiring *no* explicit
+    # importation) *OR* "None" otherwise.
+    #
+    # Note that builtin types (e.g., "int", "str") are the most common types
+    # passed to this adder. Since builtin types are trivially isinstanceable,
+    # builtin types are intentionally detected *BEFORE* validating this type
+    # below, reducing the common case to a single dictionary lookup.
+    try:
+        cls_basename = TYPE_BUILTIN_TO_NAME.get(cls)
+    # If this object is unhashable, this object is *NOT* a builtin type. In this
+    # case, defer to the validation performed below.
+    except TypeError:
+        cls_basename = None
+
+    # If this type is a builtin, return the unqualified basename of this type
+    # as is, as this type requires no parametrization.
+    if cls_basename is not None:
+        return cls_basename
+    # Else, this object is *NOT* a builtin type.
+
     # If this object is *NOT* an isinstanceable class, raise an exception.
     die_unless_type_isinstanceable(cls=cls, exception_prefix=exception_prefix)
-    # Else, this object is an isinstanceable class.
+    # Else, this object is an isinstanceable non-builtin class.
 
-    # Return either...
-    return (
-        # If this type is a builtin (i.e., globally accessible C-based type
-        # requiring *no* explicit importation), the unqualified basename of
-        # this type as is, as this type requires no parametrization;
-        get_object_type_basename(cls)
-        if is_type_builtin(cls) else
-        # Else, the name of a new parameter passing this class.
-        add_func_scope_attr(
-            func_scope=func_scope, attr=cls, exception_prefix=exception_prefix)
-    )
+    # Return the name of a new parameter passing this class.
+    return add_func_scope_attr(
+        func_scope=func_scope, attr=cls, exception_prefix=exception_prefix)
 
 
 def add_func_scope_types(
@@ -298,54 +317,46 @@ def add_func_scope_types(
     refer to the passed set or tuple of classes and whose value is that tuple)
     to the passed scope *and* return that machine-readable name.
 
-    This function additionally caches this tuple with the beartypistry
-    singleton to reduce space consumption for tuples duplicated across the
-    active Python interpreter.
+    This function additionally caches this tuple with the private tuple union
+    cache to reduce space consumption for tuples duplicated across the active
+    Python interpreter.
 
     Design
     ------
     Unlike types, tuples are commonly dynamically constructed on-the-fly by
     various tuple factories (e.g., :attr:`beartype.cave.NoneTypeOr`,
     :attr:`typing.Optional`) and hence have no reliable fully-qualified names.
-    Instead, this function caches this tuple into the beartypistry under a
-    string synthesized as the unique concatenation of:
-
-    * The magic substring :data:`TYPISTRY_HINT_NAME_TUPLE_PREFIX`. Since
-      fully-qualified classnames uniquely identifying types as beartypistry keys
-      are guaranteed to *never* contain this substring, this substring prevents
-      collisions between tuple and type names.
-    * This tuple's hash. Note that this tuple's object ID is intentionally *not*
-      embedded in this string. Two tuples with the same items are typically
-      different objects and thus have different object IDs, despite producing
-      identical hashes: e.g.,
-
-      >>> ('Das', 'Kapitel',) is ('Das', 'Kapitel',)
-      False
-      >>> id(('Das', 'Kapitel',)) == id(('Das', 'Kapitel',))
-      False
-      >>> hash(('Das', 'Kapitel',)) == hash(('Das', 'Kapitel',))
-      True
-
-    The exception is the empty tuple, which is a singleton and thus *always* has
-    the same object ID and hash: e.g.,
-
-        >>> () is ()
-        True
-        >>> id(()) == id(())
-        True
-        >>> hash(()) == hash(())
-        True
-
-    Identifying tuples by their hashes enables the beartypistry singleton to
-    transparently cache duplicate class tuples with distinct object IDs as the
-    same underlying object, reducing space consumption. While hashing tuples
-    does impact time performance, the gain in space is worth the cost.
+    Instead, this function:
+
+    #. Deduplicates this tuple against the private tuple union cache, keyed by
+       this tuple's hash rather than object ID. Two tuples with the same items
+       are typically different objects and thus have different object IDs,
+       despite producing identical hashes: e.g.,
+
+       >>> ('Das', 'Kapitel',) is ('Das', 'Kapitel',)
+       False
+       >>> id(('Das', 'Kapitel',)) == id(('Das', 'Kapitel',))
+       False
+       >>> hash(('Das', 'Kapitel',)) == hash(('Das', 'Kapitel',))
+       True
+
+    #. Adds the resulting canonical tuple to this scope under a name
+       synthesized from the object ID of that canonical tuple by the
+       :func:`beartype._util.func.utilfuncscope.add_func_scope_attr` adder.
+       Since that name embeds an integer rather than a hash, synthesizing that
+       name neither rehashes this tuple nor incurs string formatting costs
+       proportional to the length of this tuple.
+
+    Identifying tuples by their hashes enables this cache to transparently
+    deduplicate class tuples with distinct object IDs as the same underlying
+    object, reducing space consumption. While hashing tuples does impact time
+    performance, the gain in space is worth the cost.
 
     Parameters
     ----------
     func_scope : LexicalScope
         Local or global scope to add this object to.
-    types : _SetOrTupleOfTypes
+    types : SetOrTupleTypes
         Set or tuple of arbitrary types to be added to this scope.
     is_unique : bool, optional
         ``True`` only if the caller guarantees this tuple to contain *no*
@@ -353,9 +364,10 @@ def add_func_scope_types(
         than tuple. Defaults to :data:`False`. :data:`False`, this function
         assumes this tuple to contain duplicate types by internally:
 
-        #. Coercing this tuple into a set, thus implicitly ignoring both
-           duplicates and ordering of types in this tuple.
-        #. Coercing that set back into another tuple.
+        #. Coercing this tuple into a dictionary whose keys are the types in
+           this tuple, thus implicitly ignoring duplicates while preserving
+           the ordering of types in this tuple.
+        #. Coercing the keys of that dictionary back into another tuple.
         #. If these two tuples differ, the passed tuple contains one or more
            duplicates; in this case, the duplicate-free tuple is cached and
            passed.
@@ -395,61 +407,168 @@ def add_func_scope_types(
     '''
     assert is_unique.__class__ is bool, f'{repr(is_unique)} not bool.'
 
+    # If this container is a tuple previously canonicalized by a prior call to
+    # this adder, this tuple has already been validated, deduplicated, and
+    # cached. In this case, avoid repeating that work (including rehashing this
+    # tuple) by immediately returning the name of a new parameter passing this
+    # tuple.
+    #
+    # Note that this object identifier is safely usable as a key, as the tuple
+    # union cache strongly refers to all canonical tuples and thus prevents
+    # those tuples from being garbage-collected and their identifiers reused.
+    if _tuple_union_id_to_tuple_union.get(id(types)) is types:
+        return add_func_scope_attr(
+            attr=types,
+            func_scope=func_scope,
+            exception_prefix=exception_prefix,
+        )
+    # Else, this container has yet to be canonicalized.
+
+    # True only if this container is a tuple. Since the overwhelming majority
+    # of containers passed to this adder are tuples, this container is only
+    # tested against the tuple of all set types when *NOT* a tuple. This
+    # boolean is then reused below rather than repeatedly retesting the type
+    # of this container.
+    is_types_tuple = isinstance(types, tuple)
+
     # If this container is neither a set nor tuple, raise an exception.
-    if not isinstance(types, TYPES_SET_OR_TUPLE):
+    if not (is_types_tuple or isinstance(types, TYPES_SET)):
         raise BeartypeDecorHintNonpepException(
             f'{exception_prefix}{repr(types)} neither set nor tuple.')
     # Else, this container is either a set or tuple.
-    #
+
+    # Number of types in this container, computed once and reused below both
+    # to classify this container *AND* to deduplicate this container.
+    types_len = len(types)
+
     # If this container is empty, raise an exception.
-    elif not types:
+    if not types_len:
         raise BeartypeDecorHintNonpepException(f'{exception_prefix}empty.')
     # Else, this container is non-empty.
     #
-    # If this container only contains one type, register only this type.
-    elif len(types) == 1:
+    # If this container only contains one type, register only this type. Since
+    # add_func_scope_type() validates this type, this container is
+    # intentionally *NOT* validated below in this common case.
+    elif types_len == 1:
         return add_func_scope_type(
             # The first and only item of this container, accessed as either:
             # * If this container is a tuple, that item with fast indexing.
             # * If this container is a set, that item with slow iteration.
-            cls=types[0] if isinstance(types, tuple) else next(iter(types)),
+            cls=types[0] if is_types_tuple else next(iter(types)),
             func_scope=func_scope,
             exception_prefix=exception_prefix,
         )
     # Else, this container either contains two or more types.
 
-    # If this container is a frozenset, coerce this frozenset into a tuple.
-    if isinstance(types, Set):
+    # Frozen set passed by the caller if this container is a frozen set *OR*
+    # "None" otherwise.
+    types_frozenset: Optional[FrozenSet[type]] = None
+
+    # If this container is a set...
+    if not is_types_tuple:
+        # If this set is a frozen set...
+        if isinstance(types, frozenset):
+            # Canonical tuple previously cached for this frozen set if any *OR*
+            # "None" otherwise.
+            #
+            # Note that frozen sets internally cache their hashes, unlike
+            # tuples. Looking up this frozen set as is thus avoids both coercing
+            # this frozen set into a new tuple *AND* hashing that tuple.
+            types_cached = _tuple_union_to_tuple_union.get(types)
+
+            # If this frozen set has already been cached, return the name of a
+            # new parameter passing the canonical tuple cached for this set.
+            if types_cached is not None:
+                return add_func_scope_attr(
+                    attr=types_cached,
+                    func_scope=func_scope,
+                    exception_prefix=exception_prefix,
+                )
+            # Else, this frozen set has yet to be cached.
+
+            # Record this frozen set for caching below.
+            types_frozenset = types
+
+        # Coerce this set into a tuple.
         types = tuple(types)
-    # Else, this container is *NOT* a frozenset. By elimination, this container
+    # Else, this container is *NOT* a set. By elimination, this container
     # should now be a tuple.
     #
     # In either case, this container should now be a tuple.
 
     # If either this container is *NOT* a tuple or is a tuple containing one or
     # more items that are *NOT* isinstanceable classes, raise an exception.
-    die_unless_type_or_types_isinstanceable(
-        type_or_types=types, exception_prefix=exception_prefix)
+    #
+    # Note that the heavyweight raiser called below is *ONLY* called when the
+    # lightweight tester called here fails. Since the former dominates the cost
+    # of this adder in the common case of a valid tuple, this adder avoids
+    # calling the former in that case.
+    if not is_types_isinstanceable(types):
+        die_unless_type_or_types_isinstanceable(
+            type_or_types=types, exception_prefix=exception_prefix)
     # Else, this container is a tuple containing only isinstanceable classes.
 
-    # If this container is a tuple *AND* the caller failed to guarantee this
-    # tuple to be duplicate-free, coerce this tuple into (in order):
-    # * A set, thus ignoring duplicates and ordering.
-    # * Back into a duplicate-free tuple.
-    if isinstance(types, tuple) and not is_unique:
-        types = tuple(set(types))
+    # If this container was originally a tuple rather than a set (which is
+    # already guaranteed to be duplicate-free) *AND* the caller failed to
+    # guarantee this tuple to be duplicate-free...
+    if is_types_tuple and not is_unique:
+        # If this tuple is *NOT* trivially decidable as duplicate-free by
+        # pairwise comparison of its items, coerce this tuple into (in order):
+        # * A dictionary whose keys are the items of this tuple, thus ignoring
+        #   duplicates while preserving ordering.
+        # * Back into a duplicate-free tuple.
+        #
+        # Note that most tuples of classes contain only two or three classes.
+        # Since pairwise comparison of those classes avoids both hashing those
+        # classes and allocating a temporary dictionary, this tuple is only
+        # coerced in the uncommon case of larger tuples *OR* tuples with
+        # duplicates.
+        #
+        # Note that a dictionary rather than set is intentionally leveraged
+        # here. Since sets do *NOT* preserve ordering, coercing a tuple into a
+        # set and back again reorders that tuple non-deterministically across
+        # Python processes, which then reorders the isinstance() checks
+        # embedded in type-checking code generated for that tuple.
+        if not (
+            (
+                types_len == 2 and
+                types[0] != types[1]
+            ) or
+            (
+                types_len == 3 and
+                types[0] != types[1] and
+                types[0] != types[2] and
+                types[1] != types[2]
+            )
+        ):
+            types = tuple(dict.fromkeys(types))
+        # Else, this tuple is a duplicate-free tuple of two or three classes.
     # In either case, this container is now guaranteed to be a tuple
     # containing only duplicate-free classes.
     assert isinstance(types, tuple), (
         f'{exception_prefix}{repr(types)} not tuple.')
 
+    # Previously cached tuple equal to this tuple if any *OR* "None" otherwise.
+    #
+    # Note that this tuple is intentionally looked up with a single call to the
+    # dict.get() method rather than both a "types in ..." test *AND* a
+    # subsequent "...[types]" lookup. Since tuples do *NOT* cache their hashes,
+    # the latter would hash this tuple twice in the common case of a cache hit.
+    types_cached = _tuple_union_to_tuple_union.get(types)
+
     # If this tuple has *NOT* already been cached, do so.
-    if types not in _tuple_union_to_tuple_union:
+    if types_cached is None:
         _tuple_union_to_tuple_union[types] = types
+        _tuple_union_id_to_tuple_union[id(types)] = types
     # Else, this tuple has already been cached. In this case, deduplicate this
     # tuple by reusing the previously cached tuple.
     else:
-        types = _tuple_union_to_tuple_union[types]
+        types = types_cached
+
+    # If the caller passed a frozen set, map that set to this canonical tuple.
+    if types_frozenset is not None:
+        _tuple_union_to_tuple_union[types_frozenset] = types
+    # Else, the caller passed either a tuple or non-frozen set.
 
     # Return the name of a new parameter passing this tuple.
     return add_func_scope_attr(
@@ -554,23 +673,46 @@ def express_func_scope_type_ref(
         # Placeholder substring to be replaced by the caller with a Python
         # expression evaluating to this unqualified classname canonicalized
         # relative to the module declaring the currently decorated callable
-        # when accessed via the private "__beartypistry" parameter.
-        ref_expr = (
-            f'{CODE_HINT_REF_TYPE_BASENAME_PLACEHOLDER_PREFIX}'
-            f'{ref_name}'
-            f'{CODE_HINT_REF_TYPE_BASENAME_PLACEHOLDER_SUFFIX}'
-        )
+        # when accessed via the private "__beartypistry" parameter, previously
+        # synthesized for this classname by a prior call to this expresser.
+        ref_expr = _ref_name_to_ref_placeholder.get(ref_name)
+
+        # If *NO* such placeholder has been synthesized yet, synthesize and
+        # cache this placeholder. Since the same unqualified classnames recur
+        # across many type hints (e.g., "list['MuhClass']",
+        # "dict[str, 'MuhClass']"), this cache both avoids repeatedly
+        # concatenating identical strings *AND* deduplicates those strings.
+        if ref_expr is None:
+            ref_expr = _ref_name_to_ref_placeholder[ref_name] = (
+                CODE_HINT_REF_TYPE_BASENAME_PLACEHOLDER_PREFIX +
+                ref_name +
+                CODE_HINT_REF_TYPE_BASENAME_PLACEHOLDER_SUFFIX
+            )
+        # Else, this placeholder has already been synthesized.
 
     # Return a 2-tuple of this expression and set of unqualified classnames.
     return ref_expr, forwardrefs_class_basename
 
 # ....................{ PRIVATE ~ globals                  }....................
-_tuple_union_to_tuple_union: Dict[TupleTypes, TupleTypes] = {}
+_ref_name_to_ref_placeholder: Dict[str, str] = {}
+'''
+**Relative forward reference placeholder cache** (i.e., dictionary mapping from
+the unqualified classname referred to by each relative forward reference passed
+to the :func:`.express_func_scope_type_ref` expresser to the placeholder
+substring synthesized by that expresser for that classname).
+'''
+
+
+_tuple_union_to_tuple_union: Dict[SetOrTupleTypes, TupleTypes] = {}
 '''
 **Tuple union cache** (i.e., dictionary mapping from each tuple union passed to
 the :func:`.add_func_scope_types` adder to that same union, preventing tuple
 unions from being duplicated across calls to that adder).
 
+This cache additionally maps from each frozen set of two or more types passed
+to that adder to the canonical tuple union coerced from that set, enabling that
+adder to reuse that union without coercing that set into a new tuple.
+
 This cache serves a dual purpose. Notably, this cache both enables:
 
 * External callers to iterate over all previously instantiated forward reference
@@ -580,3 +722,18 @@ This cache serves a dual purpose. Notably, this cache both enables:
   unions. Since the existing ``callable_cached`` decorator could trivially do so
   as well, however, this is only a negligible side effect.
 '''
+
+
+_tuple_union_id_to_tuple_union: Dict[int, TupleTypes] = {}
+'''
+**Tuple union identity cache** (i.e., dictionary mapping from the object
+identifier of each canonical tuple union cached by the
+:data:`._tuple_union_to_tuple_union` cache to that union).
+
+This cache enables the :func:`.add_func_scope_types` adder to detect canonical
+tuple unions repeatedly passed to that adder by identity rather than by hash,
+avoiding both rehashing and revalidating those unions. Since tuples are *not*
+weakly referenceable, this cache is only safe as long as the
+:data:`._tuple_union_to_tuple_union` cache strongly refers to these unions.
+Both caches *must* thus always be cleared together.
+'''
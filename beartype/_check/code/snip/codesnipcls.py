@@ -14,3 +14,93 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 
+from beartype._check.code.snip.codesnipstr import (
+    PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX,
+    PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX,
+)
+
+# ....................{ SUBCLASSES                         }....................
+class HintChildPlaceholderCache(dict):
+    '''
+    **Hint child placeholder cache** (i.e., dictionary mapping from the 0-based
+    integer uniquely identifying each child type hint visited by the
+    breadth-first search (BFS) performed by the
+    :func:`beartype._check.code.codemake.make_check_expr` factory to the
+    placeholder substring to be replaced by code type-checking that hint).
+
+    See Also
+    --------
+    :data:`.HINT_CHILD_INDEX_TO_PLACEHOLDER`
+        Singleton instance of this dictionary subclass.
+    '''
+
+    # ....................{ DUNDERS                        }....................
+    def __missing__(self, hint_child_index: int) -> str:
+        '''
+        Dunder method explicitly called by the superclass
+        :meth:`dict.__getitem__` method implicitly called on the first ``[``-
+        and ``]``-delimited attempt to access a placeholder substring with the
+        passed integer.
+
+        Parameters
+        ----------
+        hint_child_index : int
+            0-based integer uniquely identifying the child hint whose
+            placeholder substring is to be created, cached, and returned.
+
+        Returns
+        -------
+        str
+            Placeholder substring uniquely identified by this integer.
+
+        Raises
+        ------
+        AssertionError
+            If either:
+
+            * ``hint_child_index`` is *not* an integer.
+            * ``hint_child_index`` is a **negative integer** (i.e., is less than
+              0).
+        '''
+        assert isinstance(hint_child_index, int)
+        assert hint_child_index >= 0
+
+        # Placeholder substring uniquely identified by this integer.
+        hint_child_placeholder = (
+            f'{PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX}'
+            f'{str(hint_child_index)}'
+            f'{PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
+        )
+
+        # Cache this placeholder substring.
+        self[hint_child_index] = hint_child_placeholder
+
+        # Return this placeholder substring.
+        return hint_child_placeholder
+
+# ....................{ DICTS                              }....................
+HINT_CHILD_INDEX_TO_PLACEHOLDER = HintChildPlaceholderCache()
+'''
+**Hint child placeholder cache singleton** (i.e., global dictionary efficiently
+mapping from the 0-based integer uniquely identifying each child type hint
+visited by the breadth-first search (BFS) performed by the
+:func:`beartype._check.code.codemake.make_check_expr` factory to the
+placeholder substring to be replaced by code type-checking that hint).
+
+Since that BFS identifies the child hints it visits with the same small
+integers on every call, this cache dynamically creates and efficiently caches
+each placeholder substring on the first access of that substring, obviating
+the performance cost of the string formatting otherwise required to create
+that substring on visiting each child hint.
+
+Examples
+--------
+.. code-block:: pycon
+
+   >>> from beartype._check.code.snip.codesnipcls import (
+   ...     HINT_CHILD_INDEX_TO_PLACEHOLDER)
+   >>> HINT_CHILD_INDEX_TO_PLACEHOLDER[0]
+   '@[0)!'
+   >>> HINT_CHILD_INDEX_TO_PLACEHOLDER[0] is HINT_CHILD_INDEX_TO_PLACEHOLDER[0]
+   True
+'''
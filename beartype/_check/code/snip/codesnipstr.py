@@ -17,12 +17,17 @@ from beartype._check.checkmagic import (
 )
 
 # ....................{ PITH                               }....................
-PEP_CODE_PITH_ASSIGN_EXPR = '''{pith_curr_var_name} := {pith_curr_expr}'''
+PEP_CODE_PITH_ASSIGN_EXPR = '''%s := %s'''
 '''
 Python >= 3.8-specific assignment expression assigning the full Python
 expression yielding the value of the current pith to a unique local variable,
 enabling PEP-compliant child hints to obtain this pith via this efficient
 variable rather than via this inefficient full Python expression.
+
+This snippet is a positional ``%``-style template rather than a keyword
+:meth:`str.format` template, as this snippet is formatted once for each
+visited container hint. Formatting is passed a 2-tuple ``(pith_curr_var_name,
+pith_curr_expr)`` of the name of that variable and that expression.
 '''
 
 # ....................{ HINT ~ placeholder : child         }....................
@@ -295,12 +300,19 @@ to be a subclass of the subscripted child hint of a :pep:`484`- or
 '''
 
 # ....................{ HINT ~ pep : 484 : instance        }....................
-PEP484_CODE_HINT_INSTANCE = (
-    '''isinstance({pith_curr_expr}, {hint_curr_expr})''')
+PEP484_CODE_HINT_INSTANCE = '''isinstance(%s, %s)'''
 '''
 :pep:`484`-compliant code snippet type-checking the current pith against the
 current child PEP-compliant type expected to be a trivial non-:mod:`typing`
 type (e.g., :class:`int`, :class:`str`).
+
+This snippet is a positional ``%``-style template rather than a keyword
+:meth:`str.format` template, as this snippet is formatted once for each
+visited leaf type and is thus the most frequently formatted snippet. Positional
+``%``-style formatting is roughly three times faster than keyword
+:meth:`str.format` formatting for templates this small. Formatting is passed
+a 2-tuple ``(pith_curr_expr, hint_curr_expr)`` of the current pith expression
+and the Python expression evaluating to this type.
 '''
 
 # ....................{ HINT ~ pep : 484 : union           }....................
@@ -44,13 +44,21 @@ This set includes:
 '''
 
 
-TYPES_SET_OR_TUPLE = (SetABC, tuple)
+TYPES_SET = (frozenset, set, SetABC)
 '''
-2-tuple containing the superclasses of all frozen sets and tuples.
+3-tuple containing the superclasses of all sets.
 
-Note that the :class:`Set` abstract base class (ABC) rather than the concrete
-:class:`set` subclass is intentionally listed here, as the concrete
-:class:`frozenset` subclass subclasses the former but *not* latter: e.g.,
+This tuple intentionally lists the concrete :class:`frozenset` and :class:`set`
+builtin types *before* the :class:`Set` abstract base class (ABC). Since the
+:func:`isinstance` builtin tests the items of a tuple in order, doing so
+reduces the common case of testing builtin sets against this tuple to a fast
+type identity check, deferring to the comparatively slow ABC machinery
+underlying the latter *only* for the uncommon case of non-builtin sets (e.g.,
+dictionary key views).
+
+Note that the :class:`Set` ABC rather than merely the concrete :class:`set`
+subclass is intentionally listed here, as the concrete :class:`frozenset`
+subclass subclasses the former but *not* latter: e.g.,
 
 .. code-block:: python
 
@@ -100,6 +108,22 @@ requiring *no* explicit importation) to that type.
 '''
 
 
+# Defined below by the _init() function.
+TYPE_BUILTIN_TO_NAME: Dict[type, str] = None  # type: ignore[assignment]
+'''
+Dictionary mapping from each **builtin type** (i.e., globally accessible C-based
+type implicitly accessible from all scopes and thus requiring *no* explicit
+importation) to the unqualified basename of that type.
+
+This dictionary is the inverse of the :data:`.TYPE_BUILTIN_NAME_TO_TYPE`
+dictionary, excluding aliases (e.g., :class:`EnvironmentError`, an alias of
+:class:`OSError`). Each builtin type maps to its canonical name (i.e., the
+value of its ``__name__`` dunder attribute), enabling callers to reduce the
+common case of deciding whether an arbitrary type is builtin *and* retrieving
+the name of that type to a single dictionary lookup.
+'''
+
+
 # Defined below by the _init() function.
 TYPES_BUILTIN: FrozenSet[type] = None  # type: ignore[assignment]
 '''
@@ -140,7 +164,7 @@ def _init() -> None:
     from builtins import __dict__ as BUILTIN_NAME_TO_TYPE  # type: ignore[attr-defined]
 
     # Global variables redefined below.
-    global TYPE_BUILTIN_NAME_TO_TYPE, TYPES_BUILTIN
+    global TYPE_BUILTIN_NAME_TO_TYPE, TYPE_BUILTIN_TO_NAME, TYPES_BUILTIN
 
     # Dictionary mapping from,...
     TYPE_BUILTIN_NAME_TO_TYPE = {
@@ -163,6 +187,11 @@ def _init() -> None:
     # Frozenset of all builtin types, derived from this dictionary.
     TYPES_BUILTIN = frozenset(TYPE_BUILTIN_NAME_TO_TYPE.values())
 
+    # Dictionary mapping from each builtin type to its canonical name, derived
+    # from this frozenset.
+    TYPE_BUILTIN_TO_NAME = {
+        builtin_type: builtin_type.__name__ for builtin_type in TYPES_BUILTIN}
+
 
 # Initialize this submodule.
 _init()
@@ -29,9 +29,13 @@ from beartype._util.func.arg.utilfuncargtest import (
     is_func_arg_variadic,
 )
 from beartype._util.text.utiltextlabel import label_callable
-from beartype._util.utilobject import SENTINEL
 from collections.abc import Callable
 from functools import wraps
+from inspect import (
+    CO_VARARGS,
+    CO_VARKEYWORDS,
+)
+from types import FunctionType
 
 # ....................{ PRIVATE ~ hints                    }....................
 _CallableT = TypeVar('_CallableT', bound=Callable)
@@ -63,10 +67,10 @@ def callable_cached(func: _CallableT) -> _CallableT:
        #. Tests whether this callable has already been called at least once
           with the passed parameters by lookup of those parameters in these
           dictionaries.
-       #. If this callable previously raised an exception when passed these
-          parameters, this wrapper re-raises the same exception.
-       #. Else if this callable returned a value when passed these parameters,
+       #. If this callable returned a value when passed these parameters,
           this wrapper re-returns the same value.
+       #. Else if this callable previously raised an exception when passed
+          these parameters, this wrapper re-raises the same exception.
        #. Else, this wrapper:
 
           #. Calls that callable with those parameters.
@@ -170,9 +174,6 @@ def callable_cached(func: _CallableT) -> _CallableT:
     # if any (i.e., if that call did *NOT* raise an exception).
     args_flat_to_return_value: Dict[tuple, object] = {}
 
-    # get() method of this dictionary, localized for efficiency.
-    args_flat_to_return_value_get = args_flat_to_return_value.get
-
     # Dictionary mapping a tuple of all flattened parameters passed to each
     # prior call of the decorated callable with the exception raised by that
     # call if any (i.e., if that call raised an exception).
@@ -181,10 +182,95 @@ def callable_cached(func: _CallableT) -> _CallableT:
     # get() method of this dictionary, localized for efficiency.
     args_flat_to_exception_get = args_flat_to_exception.get
 
+    # If this callable is a pure-Python function accepting exactly one
+    # mandatory positional parameter and *NO* other parameters (e.g., the
+    # common case of a tester or getter passed only a type hint)...
+    #
+    # Since @callable_cached callables are *NEVER* passed keyword arguments,
+    # this function is guaranteed to always be passed exactly one positional
+    # argument. In this case, return a closure specialized for that argument.
+    # Doing so avoids both packing that argument into a variadic tuple *AND*
+    # testing the length of that tuple on each call, substantially reducing
+    # the cost of each call returning a previously cached value.
+    if func.__class__ is FunctionType:
+        # Code object underlying this function, localized for efficiency.
+        func_codeobj = func.__code__  # type: ignore[attr-defined]
+
+        # If this function accepts exactly one mandatory positional parameter
+        # and *NO* optional, variadic, or keyword-only parameters...
+        if (
+            func_codeobj.co_argcount == 1 and
+            not func_codeobj.co_kwonlyargcount and
+            not func_codeobj.co_flags & (CO_VARARGS | CO_VARKEYWORDS) and
+            not func.__defaults__  # type: ignore[attr-defined]
+        ):
+            @wraps(func)
+            def _callable_cached_arg(arg):
+                '''
+                Memoized variant of the decorated callable.
+
+                See Also
+                ----------
+                :func:`callable_cached`
+                    Further details.
+                '''
+
+                #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                # CAUTION: Synchronize against the general-purpose
+                # _callable_cached() closure below, which flattens a tuple of
+                # only one argument into that argument. This closure *MUST*
+                # memoize that argument under the same key.
+                #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+                # Attempt to return the value returned by a prior call to the
+                # decorated callable when passed this argument.
+                try:
+                    return args_flat_to_return_value[arg]
+                # If this callable has yet to return a value when passed this
+                # argument, silently continue to the slow path below.
+                except KeyError:
+                    pass
+                # If this argument is unhashable, perform this call as is
+                # *WITHOUT* memoization.
+                except TypeError:
+                    return func(arg)
+
+                # Exception raised by a prior call to the decorated callable
+                # when passed this argument *OR* "None" otherwise.
+                exception = args_flat_to_exception_get(arg)
+
+                # If this callable previously raised an exception when called
+                # with this argument, re-raise the same exception.
+                if exception:
+                    raise exception  # pyright: ignore[reportGeneralTypeIssues]
+                # Else, this callable has yet to be called with this argument.
+
+                # Attempt to...
+                try:
+                    # Call this parameter with this argument and cache the value
+                    # returned by this call to this argument.
+                    return_value = args_flat_to_return_value[arg] = func(arg)
+                # If this call raised an exception...
+                except Exception as exception:
+                    # Cache this exception to this argument.
+                    args_flat_to_exception[arg] = exception
+
+                    # Re-raise this exception.
+                    raise exception
+
+                # Return this value.
+                return return_value
+
+            # Return this specialized wrapper.
+            return _callable_cached_arg  # type: ignore[return-value]
+        # Else, this function accepts either two or more, optional, variadic,
+        # or keyword-only parameters.
+    # Else, this callable is *NOT* a pure-Python function.
+
     @wraps(func)
     def _callable_cached(*args):
-        f'''
-        Memoized variant of the {func.__name__}() callable.
+        '''
+        Memoized variant of the decorated callable.
 
         See Also
         ----------
@@ -206,66 +292,60 @@ def callable_cached(func: _CallableT) -> _CallableT:
             args
         )
 
-        # Attempt to...
+        # Attempt to return the value returned by a prior call to the decorated
+        # callable when passed these parameters.
+        #
+        # Note that this is the common case and thus intentionally tested first
+        # by a single dictionary lookup. Since the "try" statement is
+        # (effectively) zero-cost *AND* the "KeyError" exception below is only
+        # raised on the first call passed these parameters, each subsequent
+        # call passed these parameters reduces to this lookup alone.
         try:
-            # Exception raised by a prior call to the decorated callable when
-            # passed these parameters *OR* the sentinel placeholder otherwise
-            # (i.e., if this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception).
-            #
-            # Note that:
-            # * This statement raises a "TypeError" exception if any item of
-            #   this flattened tuple is unhashable.
-            # * A sentinel placeholder (e.g., "SENTINEL") is *NOT* needed here.
-            #   The values of the "args_flat_to_exception" dictionary are
-            #   guaranteed to *ALL* be exceptions. Since "None" is *NOT* an
-            #   exception, disambiguation between "None" and valid dictionary
-            #   values is *NOT* needed here. Although a sentinel placeholder
-            #   could still be employed, doing so would slightly reduce
-            #   efficiency for *NO* real-world gain.
-            exception = args_flat_to_exception_get(args_flat)
-
-            # If this callable previously raised an exception when called with
-            # these parameters, re-raise the same exception.
-            if exception:
-                raise exception  # pyright: ignore[reportGeneralTypeIssues]
-            # Else, this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception.
-
-            # Value returned by a prior call to the decorated callable when
-            # passed these parameters *OR* a sentinel placeholder otherwise
-            # (i.e., if this callable has yet to be passed these parameters).
-            return_value = args_flat_to_return_value_get(
-                args_flat, SENTINEL)
-
-            # If this callable has already been called with these parameters,
-            # return the value returned by that prior call.
-            if return_value is not SENTINEL:
-                return return_value
-            # Else, this callable has yet to be called with these parameters.
-
-            # Attempt to...
-            try:
-                # Call this parameter with these parameters and cache the value
-                # returned by this call to these parameters.
-                return_value = args_flat_to_return_value[args_flat] = func(
-                    *args)
-            # If this call raised an exception...
-            except Exception as exception:
-                # Cache this exception to these parameters.
-                args_flat_to_exception[args_flat] = exception
-
-                # Re-raise this exception.
-                raise exception
-        # If one or more objects either passed to *OR* returned from this call
-        # are unhashable, perform this call as is *WITHOUT* memoization. While
-        # non-ideal, stability is better than raising a fatal exception.
+            return args_flat_to_return_value[args_flat]
+        # If this callable has yet to return a value when passed these
+        # parameters, silently continue to the slow path below.
+        except KeyError:
+            pass
+        # If one or more objects passed to this call are unhashable, perform
+        # this call as is *WITHOUT* memoization. While non-ideal, stability is
+        # better than raising a fatal exception.
         except TypeError:
             #FIXME: If testing, emit a non-fatal warning or possibly even raise
             #a fatal exception. In either case, we want our test suite to notify
             #us about this.
             return func(*args)
 
+        # Exception raised by a prior call to the decorated callable when passed
+        # these parameters *OR* "None" otherwise (i.e., if this callable has yet
+        # to be called with these parameters).
+        #
+        # Note that a sentinel placeholder (e.g., "SENTINEL") is *NOT* needed
+        # here. The values of the "args_flat_to_exception" dictionary are
+        # guaranteed to *ALL* be exceptions. Since "None" is *NOT* an exception,
+        # disambiguation between "None" and valid dictionary values is *NOT*
+        # needed here.
+        exception = args_flat_to_exception_get(args_flat)
+
+        # If this callable previously raised an exception when called with
+        # these parameters, re-raise the same exception.
+        if exception:
+            raise exception  # pyright: ignore[reportGeneralTypeIssues]
+        # Else, this callable has yet to be called with these parameters.
+
+        # Attempt to...
+        try:
+            # Call this parameter with these parameters and cache the value
+            # returned by this call to these parameters.
+            return_value = args_flat_to_return_value[args_flat] = func(
+                *args)
+        # If this call raised an exception...
+        except Exception as exception:
+            # Cache this exception to these parameters.
+            args_flat_to_exception[args_flat] = exception
+
+            # Re-raise this exception.
+            raise exception
+
         # Return this value.
         return return_value
 
@@ -393,9 +473,6 @@ def method_cached_arg_by_id(func: _CallableT) -> _CallableT:
     # if any (i.e., if that call did *NOT* raise an exception).
     args_flat_to_return_value: Dict[tuple, object] = {}
 
-    # get() method of this dictionary, localized for efficiency.
-    args_flat_to_return_value_get = args_flat_to_return_value.get
-
     # Dictionary mapping a tuple of all flattened parameters passed to each
     # prior call of the decorated callable with the exception raised by that
     # call if any (i.e., if that call raised an exception).
@@ -406,8 +483,8 @@ def method_cached_arg_by_id(func: _CallableT) -> _CallableT:
 
     @wraps(func)
     def _method_cached(self_or_cls, arg):
-        f'''
-        Memoized variant of the {func.__name__}() callable.
+        '''
+        Memoized variant of the decorated callable.
 
         See Also
         ----------
@@ -419,66 +496,60 @@ def method_cached_arg_by_id(func: _CallableT) -> _CallableT:
         # decorated method.
         args_flat = (id(self_or_cls), id(arg))
 
-        # Attempt to...
+        # Attempt to return the value returned by a prior call to the decorated
+        # callable when passed these parameters.
+        #
+        # Note that this is the common case and thus intentionally tested first
+        # by a single dictionary lookup. Since the "try" statement is
+        # (effectively) zero-cost *AND* the "KeyError" exception below is only
+        # raised on the first call passed these parameters, each subsequent
+        # call passed these parameters reduces to this lookup alone.
         try:
-            # Exception raised by a prior call to the decorated callable when
-            # passed these parameters *OR* the sentinel placeholder otherwise
-            # (i.e., if this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception).
-            #
-            # Note that:
-            # * This statement raises a "TypeError" exception if any item of
-            #   this flattened tuple is unhashable.
-            # * A sentinel placeholder (e.g., "SENTINEL") is *NOT* needed here.
-            #   The values of the "args_flat_to_exception" dictionary are
-            #   guaranteed to *ALL* be exceptions. Since "None" is *NOT* an
-            #   exception, disambiguation between "None" and valid dictionary
-            #   values is *NOT* needed here. Although a sentinel placeholder
-            #   could still be employed, doing so would slightly reduce
-            #   efficiency for *NO* real-world gain.
-            exception = args_flat_to_exception_get(args_flat)
-
-            # If this callable previously raised an exception when called with
-            # these parameters, re-raise the same exception.
-            if exception:
-                raise exception  # pyright: ignore[reportGeneralTypeIssues]
-            # Else, this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception.
-
-            # Value returned by a prior call to the decorated callable when
-            # passed these parameters *OR* a sentinel placeholder otherwise
-            # (i.e., if this callable has yet to be passed these parameters).
-            return_value = args_flat_to_return_value_get(
-                args_flat, SENTINEL)
-
-            # If this callable has already been called with these parameters,
-            # return the value returned by that prior call.
-            if return_value is not SENTINEL:
-                return return_value
-            # Else, this callable has yet to be called with these parameters.
-
-            # Attempt to...
-            try:
-                # Call this parameter with these parameters and cache the value
-                # returned by this call to these parameters.
-                return_value = args_flat_to_return_value[args_flat] = func(
-                    self_or_cls, arg)
-            # If this call raised an exception...
-            except Exception as exception:
-                # Cache this exception to these parameters.
-                args_flat_to_exception[args_flat] = exception
-
-                # Re-raise this exception.
-                raise exception
-        # If one or more objects either passed to *OR* returned from this call
-        # are unhashable, perform this call as is *WITHOUT* memoization. While
-        # non-ideal, stability is better than raising a fatal exception.
+            return args_flat_to_return_value[args_flat]
+        # If this callable has yet to return a value when passed these
+        # parameters, silently continue to the slow path below.
+        except KeyError:
+            pass
+        # If one or more objects passed to this call are unhashable, perform
+        # this call as is *WITHOUT* memoization. While non-ideal, stability is
+        # better than raising a fatal exception.
         except TypeError:
             #FIXME: If testing, emit a non-fatal warning or possibly even raise
             #a fatal exception. In either case, we want our test suite to notify
             #us about this.
             return func(self_or_cls, arg)
 
+        # Exception raised by a prior call to the decorated callable when passed
+        # these parameters *OR* "None" otherwise (i.e., if this callable has yet
+        # to be called with these parameters).
+        #
+        # Note that a sentinel placeholder (e.g., "SENTINEL") is *NOT* needed
+        # here. The values of the "args_flat_to_exception" dictionary are
+        # guaranteed to *ALL* be exceptions. Since "None" is *NOT* an exception,
+        # disambiguation between "None" and valid dictionary values is *NOT*
+        # needed here.
+        exception = args_flat_to_exception_get(args_flat)
+
+        # If this callable previously raised an exception when called with
+        # these parameters, re-raise the same exception.
+        if exception:
+            raise exception  # pyright: ignore[reportGeneralTypeIssues]
+        # Else, this callable has yet to be called with these parameters.
+
+        # Attempt to...
+        try:
+            # Call this parameter with these parameters and cache the value
+            # returned by this call to these parameters.
+            return_value = args_flat_to_return_value[args_flat] = func(
+                self_or_cls, arg)
+        # If this call raised an exception...
+        except Exception as exception:
+            # Cache this exception to these parameters.
+            args_flat_to_exception[args_flat] = exception
+
+            # Re-raise this exception.
+            raise exception
+
         # Return this value.
         return return_value
 
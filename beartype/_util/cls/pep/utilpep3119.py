@@ -17,6 +17,7 @@ from beartype._data.hint.datahinttyping import (
     TypeException,
     TypeOrTupleTypes,
 )
+from itertools import repeat
 
 # ....................{ RAISERS ~ instance                 }....................
 def die_unless_type_isinstanceable(
@@ -629,6 +630,68 @@ def is_type_isinstanceable(cls: object) -> bool:
     return True
 
 
+def is_types_isinstanceable(types: tuple) -> bool:
+    '''
+    :data:`True` only if the passed tuple contains only **isinstanceable
+    classes** (i.e., classes whose metaclasses do *not* define an
+    ``__instancecheck__()`` dunder method that raises a :exc:`TypeError`
+    exception).
+
+    This tester is a lightweight alternative to the comparatively heavyweight
+    :func:`.die_unless_type_or_types_isinstanceable` raiser. Callers validating
+    tuples on hot paths are advised to call this tester first *and* only defer
+    to that raiser when this tester returns :data:`False`, thus only paying the
+    cost of that raiser in the uncommon edge case of invalid tuples.
+
+    Caveats
+    -------
+    See also the "Caveats" sections of the :func:`.is_type_isinstanceable`
+    docstring for further discussion.
+
+    Parameters
+    ----------
+    types : tuple
+        Tuple to be tested.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this tuple contains only isinstanceable classes.
+    '''
+    assert isinstance(types, tuple), f'{repr(types)} not tuple.'
+
+    # If this tuple contains one or more non-classes, immediately return false.
+    #
+    # Note that this test iterates over this tuple in C rather than Python by
+    # mapping the isinstance() builtin over this tuple rather than iterating
+    # over this tuple with a generator comprehension, avoiding the Python
+    # function call overhead of the latter.
+    if not all(map(isinstance, types, repeat(type))):
+        return False
+    # Else, this tuple contains only classes.
+
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: Synchronize with die_unless_type_or_types_isinstanceable().
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # Attempt to pass this tuple of classes as the second parameter to the
+    # isinstance() builtin. See is_type_isinstanceable() for further details.
+    try:
+        isinstance(None, types)  # type: ignore[arg-type]
+    # If the prior function call raised a "TypeError" exception, this tuple
+    # contains one or more classes that are *NOT* isinstanceable. In this case,
+    # return false.
+    except TypeError:
+        return False
+    # If the prior function call raised any exception *OTHER* than a "TypeError"
+    # exception, this tuple may or may not be isinstanceable. Err on the side of
+    # caution by returning true.
+    except Exception:
+        pass
+
+    # Return true.
+    return True
+
+
 def is_type_issubclassable(cls: object) -> bool:
     '''
     :data:`True` only if the passed object is either an **issubclassable class**
@@ -34,6 +34,12 @@ from beartype._util.hint.pep.proposal.utilpep544 import (
     is_hint_pep544_ignorable_or_none)
 from beartype._util.hint.pep.proposal.utilpep593 import (
     is_hint_pep593_ignorable_or_none)
+from beartype._util.hint.pep.utilpepget import (
+    get_hint_pep_args,
+    get_hint_pep_sign,
+    get_hint_pep_sign_or_none,
+    get_hint_pep_typevars,
+)
 from beartype._util.module.utilmodget import get_object_module_name_or_none
 from beartype._util.utilobject import get_object_type_unless_type
 from warnings import warn
@@ -433,10 +439,6 @@ def is_hint_pep(hint: object) -> bool:
         :data:`True` only if this object is a PEP-compliant type hint.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.hint.pep.utilpepget import (
-        get_hint_pep_sign_or_none)
-
     # Sign uniquely identifying this hint if this hint is PEP-compliant *OR*
     # "None" otherwise (i.e., if this hint is *NOT* PEP-compliant).
     hint_sign = get_hint_pep_sign_or_none(hint)
@@ -523,8 +525,6 @@ def is_hint_pep_ignorable(hint: object) -> bool:
         superficially appearing to do so.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.hint.pep.utilpepget import get_hint_pep_sign
     # print(f'Testing PEP hint {repr(hint)} deep ignorability...')
 
     # Sign uniquely identifying this hint.
@@ -618,9 +618,6 @@ def is_hint_pep_supported(hint: object) -> bool:
         return False
     # Else, this hint is PEP-compliant.
 
-    # Avoid circular import dependencies.
-    from beartype._util.hint.pep.utilpepget import get_hint_pep_sign
-
     # Sign uniquely identifying this hint.
     hint_sign = get_hint_pep_sign(hint)
 
@@ -654,10 +651,6 @@ def is_hint_pep_typing(hint: object) -> bool:
     '''
     # print(f'is_hint_pep_typing({repr(hint)}')
 
-    # Avoid circular import dependencies.
-    from beartype._util.hint.pep.utilpepget import (
-        get_hint_pep_sign_or_none)
-
     # Return true only if this hint is either...
     return (
         # Any PEP-compliant type hint defined by a typing module (except those
@@ -786,9 +779,6 @@ def is_hint_pep_args(hint: object) -> bool:
         hint.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.hint.pep.utilpepget import get_hint_pep_args
-
     # Return true only if this hint is subscripted by one or more arguments.
     return bool(get_hint_pep_args(hint))
 
@@ -867,9 +857,6 @@ def is_hint_pep_typevars(hint: object) -> bool:
         True
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.hint.pep.utilpepget import get_hint_pep_typevars
-
     # Return true only if this hint is parametrized by one or more type
     # variables, trivially detected by testing whether the tuple of all type
     # variables parametrizing this hint is non-empty.
@@ -63,6 +63,24 @@ def test_callable_cached() -> None:
         # decorator's conditional caching of return values.
         return with_his + sweet_voice + args
 
+
+    @callable_cached
+    def hopes_springing_high(still_ill):
+        '''
+        Arbitrary callable accepting exactly one mandatory positional parameter
+        memoized by this decorator.
+        '''
+
+        # If an arbitrary condition, raise an exception whose value depends on
+        # this parameter to exercise this decorator's conditional caching of
+        # exceptions.
+        if len(still_ill) == 6:
+            raise ValueError(still_ill)
+
+        # Else, return a value depending on this parameter to exercise this
+        # decorator's conditional caching of return values.
+        return still_ill + still_ill
+
     # ..................{ LOCALS                             }..................
     # Hashable objects to be passed as parameters below.
     bitter  = ('You', 'may', 'write', 'me', 'down', 'in', 'history',)
@@ -117,6 +135,29 @@ def test_callable_cached() -> None:
         from_savage_men(bitter, twisted, *lies) is
         from_savage_men(bitter, twisted, *lies))
 
+    # ..................{ PASS ~ single-argument             }..................
+    # Test the single-argument function defined above.
+
+    # Assert that memoizing two calls passed the same positional argument
+    # caches and returns the same value.
+    assert hopes_springing_high(lies) is hopes_springing_high(lies)
+
+    # Assert that memoizing a call expected to raise an exception does so.
+    with raises(ValueError) as exception_first_info:
+        hopes_springing_high(dust)
+
+    # Assert that repeating that call reraises the same exception.
+    with raises(ValueError) as exception_next_info:
+        hopes_springing_high(dust)
+    assert exception_first_info.value is exception_next_info.value
+
+    # Assert that passing an unhashable parameter to this callable succeeds
+    # with the expected return value.
+    assert hopes_springing_high(['Still', 'I', "'ll", 'rise',]) == [
+        'Still', 'I', "'ll", 'rise',
+        'Still', 'I', "'ll", 'rise',
+    ]
+
 
 def test_method_cached_arg_by_id() -> None:
     '''
@@ -78,3 +78,27 @@ def test_die_unless_type_issubclassable() -> None:
     # non-type.
     with raises(BeartypeDecorHintPep3119Exception):
         die_unless_type_issubclassable('Moab.')
+
+
+def test_is_types_isinstanceable() -> None:
+    '''
+    Test the
+    :func:`beartype._util.cls.pep.utilpep3119.is_types_isinstanceable`
+    tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cls.pep.utilpep3119 import is_types_isinstanceable
+    from beartype_test.a00_unit.data.data_type import (
+        Class,
+        NonIsinstanceableClass,
+    )
+
+    # Assert this tester accepts a tuple of isinstanceable types.
+    assert is_types_isinstanceable((Class, int, str)) is True
+
+    # Assert this tester rejects a tuple containing a non-isinstanceable type.
+    assert is_types_isinstanceable((Class, NonIsinstanceableClass)) is False
+
+    # Assert this tester rejects a tuple containing a non-type.
+    assert is_types_isinstanceable((Class, 'Moab.')) is False
@@ -33,3 +33,43 @@ def test_make_check_code_decoration() -> None:
         make_check_expr(str, BEARTYPE_CONF_DEFAULT) is
         make_check_expr(str, BEARTYPE_CONF_DEFAULT)
     )
+
+
+def test_make_check_code_hint_childs_many() -> None:
+    '''
+    Test the :func:`beartype._check.code.codemake.make_check_expr` function
+    when passed a hint transitively subscripted by more child hints than the
+    length of a medium fixed list.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype.typing import (
+        List,
+        Tuple,
+    )
+    from pytest import raises
+
+    # Arbitrary class local to this test, preventing the hints below from
+    # colliding with hints cached by other tests.
+    class Ozymandias(object): pass
+
+    # Fixed-length tuple hint subscripted by 300 list hints, transitively
+    # visiting 601 hints in total.
+    Hint = Tuple[tuple(List[Ozymandias] for _ in range(300))]
+
+    @beartype
+    def sunlight_upon_the_hill(sweet_dreams: Hint) -> Hint:
+        return sweet_dreams
+
+    # Arbitrary object satisfying this hint.
+    sweet_dreams = tuple([Ozymandias()] for _ in range(300))
+
+    # Assert this callable returns this object when passed this object.
+    assert sunlight_upon_the_hill(sweet_dreams) is sweet_dreams
+
+    # Assert this callable raises the expected exception when passed an object
+    # violating this hint.
+    with raises(BeartypeCallHintParamViolation):
+        sunlight_upon_the_hill(sweet_dreams[:-1] + (['Ozymandias'],))
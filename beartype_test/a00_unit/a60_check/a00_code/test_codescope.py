@@ -17,6 +17,75 @@ This submodule unit tests the public API of the private
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
 # ....................{ TESTS ~ adder                      }....................
+def test_add_func_scope_type_or_types() -> None:
+    '''
+    Test the
+    :func:`beartype._check.code.codescope.add_func_scope_type_or_types` adder.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype.roar import BeartypeDecorHintPep3119Exception
+    from beartype._cave._cavefast import CallableTypes, RegexCompiledType
+    from beartype._check.code.codescope import add_func_scope_type_or_types
+    from beartype_test.a00_unit.data.data_type import NonIsinstanceableClass
+    from gc import collect
+    from pytest import raises
+    from weakref import ref
+
+    # ....................{ PASS                           }....................
+    # For each class and tuple of classes...
+    for type_or_types in (RegexCompiledType, CallableTypes):
+        # Arbitrary scopes to be added to below.
+        func_scope_a = {}
+        func_scope_b = {}
+
+        # Add this class or tuple to the first scope.
+        scope_name_a = add_func_scope_type_or_types(
+            type_or_types=type_or_types, func_scope=func_scope_a)
+
+        # Readd this class or tuple to the second scope.
+        scope_name_b = add_func_scope_type_or_types(
+            type_or_types=type_or_types, func_scope=func_scope_b)
+
+        # Assert these names and the attributes they refer to are identical.
+        assert scope_name_a == scope_name_b
+        assert func_scope_a[scope_name_a] is func_scope_b[scope_name_b]
+
+    # Assert this adder does *NOT* add builtin types to scopes.
+    func_scope = {}
+    for _ in range(2):
+        scope_name = add_func_scope_type_or_types(
+            type_or_types=str, func_scope=func_scope)
+        assert scope_name == 'str'
+        assert not func_scope
+
+    # Arbitrary class local to this test.
+    class GiveMeYourTired(object): pass
+
+    # Weak reference to this class.
+    give_me_your_tired_weakref = ref(GiveMeYourTired)
+
+    # Add this class to an arbitrary scope.
+    func_scope = {}
+    add_func_scope_type_or_types(
+        type_or_types=GiveMeYourTired, func_scope=func_scope)
+
+    # Assert that this adder does *NOT* prevent this class from being
+    # garbage-collected after both this class and this scope are deleted.
+    del GiveMeYourTired, func_scope
+    collect()
+    assert give_me_your_tired_weakref() is None
+
+    # ....................{ FAIL                           }....................
+    # Assert this adder raises the expected exception for non-isinstanceable
+    # classes, even when repeatedly passed the same class.
+    for _ in range(2):
+        with raises(BeartypeDecorHintPep3119Exception):
+            add_func_scope_type_or_types(
+                type_or_types=NonIsinstanceableClass, func_scope={})
+
+
 def test_add_func_scope_type() -> None:
     '''
     Test the
@@ -117,8 +186,8 @@ def test_add_func_scope_types() -> None:
     # Assert this function adds a tuple of one or more standard types.
     #
     # Note that, unlike types, tuples are internally added under different
-    # objects than their originals (e.g., to ignore both duplicates and
-    # ordering) and *MUST* thus be tested by conversion to sets.
+    # objects than their originals (e.g., to ignore duplicates) and are thus
+    # tested by conversion to sets.
     types_scope_name = add_func_scope_types(
         types=types, func_scope=func_scope)
     assert set(types) == set(func_scope[types_scope_name])
@@ -134,6 +203,11 @@ def test_add_func_scope_types() -> None:
         types=types, func_scope=func_scope)
     assert set(types) == set(func_scope[types_scope_name])
 
+    # Assert this function readds the same frozenset as well.
+    types_scope_name_again = add_func_scope_types(
+        types=types, func_scope=func_scope)
+    assert types_scope_name == types_scope_name_again
+
     # Assert this function does *NOT* add tuples of one non-builtin types but
     # instead simply returns the unqualified basenames of those types.
     types = (int,)
@@ -149,11 +223,32 @@ def test_add_func_scope_types() -> None:
     assert func_scope[types_scope_name] is Class
 
     # Assert this function adds tuples containing duplicate types as tuples
-    # containing only the proper subset of non-duplicate types.
+    # containing only the proper subset of non-duplicate types, preserving the
+    # ordering of the first occurrence of each type.
+    types = (int, Class, str, Class, int, bool)
+    types_scope_name = add_func_scope_types(types=types, func_scope=func_scope)
+    assert func_scope[types_scope_name] == (int, Class, str, bool)
+
+    # Assert this function adds tuples containing only duplicate types as
+    # tuples containing only one type.
     types = (Class,)*3
     types_scope_name = add_func_scope_types(types=types, func_scope=func_scope)
     assert func_scope[types_scope_name] == (Class,)
 
+    # Assert this function adds small tuples containing *NO* duplicate types
+    # as is without reordering those types, even when the caller fails to
+    # guarantee those tuples to be duplicate-free.
+    for types in ((str, Class), (str, Class, int)):
+        types_scope_name = add_func_scope_types(
+            types=types, func_scope=func_scope)
+        assert func_scope[types_scope_name] == types
+
+    # Assert this function adds small tuples containing duplicate types as
+    # tuples containing only the proper subset of non-duplicate types.
+    types = (str, Class, str)
+    types_scope_name = add_func_scope_types(types=types, func_scope=func_scope)
+    assert func_scope[types_scope_name] == (str, Class)
+
     # Assert this function registers tuples containing *NO* duplicate types.
     types = NoneTypeOr[CallableTypes]
     types_scope_name = add_func_scope_types(
@@ -172,6 +267,12 @@ def test_add_func_scope_types() -> None:
     assert func_scope[types_scope_name_b] == types_b
     assert func_scope[types_scope_name_a] != func_scope[types_scope_name_b]
 
+    # Assert this function readds a previously added canonical tuple under the
+    # same name as that tuple.
+    types = func_scope[types_scope_name_a]
+    types_scope_name = add_func_scope_types(types=types, func_scope={})
+    assert types_scope_name == types_scope_name_a
+
     # ....................{ FAIL                           }....................
     # Arbitrary scope to be added to below.
     func_scope = {}
@@ -324,6 +425,9 @@ def test_express_func_scope_type_ref() -> None:
         assert forwardref_expr_again == forwardref_expr
         assert forwardrefs_class_basename_again == {CLASSNAME_UNQUALIFIED,}
 
+        # Assert this function reuses the same cached placeholder.
+        assert forwardref_expr_again is forwardref_expr
+
     # ....................{ FAIL                           }....................
     # Assert this function raises the expected exception for arbitrary objects
     # that are *NOT* forward references.